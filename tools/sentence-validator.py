@@ -85,6 +85,14 @@ POSTPOSITIONS = {'añ'}
 # Question particle
 QUESTION_PARTICLE = 'ka'
 
+# Affix tables ordered longest-first for greedy matching (sorted once, not per word)
+ASPECT_SUFFIX_ORDER = tuple(sorted(ASPECT_SUFFIXES, key=len, reverse=True))
+MOOD_SUFFIX_ORDER = tuple(sorted(MOOD_SUFFIXES, key=len, reverse=True))
+CASE_SUFFIX_ORDER = tuple(sorted(CASE_SUFFIXES, key=len, reverse=True))
+GENDER_SUFFIX_ORDER = tuple(sorted(GENDER_SUFFIXES, key=len, reverse=True))
+PRONOUN_ORDER = tuple(sorted(PRONOUNS, key=len, reverse=True))
+POSSESSIVE_PREFIX_ORDER = tuple(sorted(POSSESSIVE_PREFIXES, key=len, reverse=True))
+
 # ============================================================================
 # DICTIONARY LOADING
 # ============================================================================
@@ -118,28 +126,28 @@ def strip_suffixes(word: str) -> Tuple[str, List[str]]:
     original = word
     
     # Check for aspect suffixes (longest first)
-    for suffix in sorted(ASPECT_SUFFIXES.keys(), key=len, reverse=True):
+    for suffix in ASPECT_SUFFIX_ORDER:
         if word.endswith(suffix):
             word = word[:-len(suffix)]
             suffixes_found.append(f"{suffix} ({ASPECT_SUFFIXES[suffix]})")
             break
     
     # Check for mood suffixes
-    for suffix in sorted(MOOD_SUFFIXES.keys(), key=len, reverse=True):
+    for suffix in MOOD_SUFFIX_ORDER:
         if word.endswith(suffix):
             word = word[:-len(suffix)]
             suffixes_found.append(f"{suffix} ({MOOD_SUFFIXES[suffix]})")
             break
     
     # Check for case suffixes
-    for suffix in sorted(CASE_SUFFIXES.keys(), key=len, reverse=True):
+    for suffix in CASE_SUFFIX_ORDER:
         if word.endswith(suffix):
             word = word[:-len(suffix)]
             suffixes_found.append(f"{suffix} ({CASE_SUFFIXES[suffix]})")
             break
     
     # Check for gender/derivational suffixes (before interfix check)
-    for suffix in sorted(GENDER_SUFFIXES.keys(), key=len, reverse=True):
+    for suffix in GENDER_SUFFIX_ORDER:
         if word.endswith(suffix):
             word = word[:-len(suffix)]
             suffixes_found.append(f"{suffix} ({GENDER_SUFFIXES[suffix]})")
@@ -181,7 +189,7 @@ def validate_word(word: str, dictionary_words: set, verbose: bool = False) -> Tu
         return True, []
     
     # Check for pronoun + interfix + case suffix pattern
-    for pronoun in sorted(PRONOUNS, key=len, reverse=True):
+    for pronoun in PRONOUN_ORDER:
         if word.startswith(pronoun):
             remainder = word[len(pronoun):]
             # Check for interfix -w- followed by case suffix
@@ -215,7 +223,7 @@ def validate_word(word: str, dictionary_words: set, verbose: bool = False) -> Tu
     # (to avoid stripping šā from šāk which means "praise")
     possessive_prefix = None
     word_without_prefix = word
-    for prefix in sorted(POSSESSIVE_PREFIXES.keys(), key=len, reverse=True):
+    for prefix in POSSESSIVE_PREFIX_ORDER:
         if word.startswith(prefix) and len(word) > len(prefix):
             potential_remainder = word[len(prefix):]
             # Strip suffixes from remainder and check
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for validator.py dictionary access.
+
+Usage:
+    python -m unittest test_validator
+"""
+
+import unittest
+
+import validator
+
+
+class DictionaryCopyTests(unittest.TestCase):
+    """Entries handed to callers must not alias the cached dictionary."""
+
+    def setUp(self):
+        self.entry = validator.list_words()[0]
+        self.english = self.entry["english"]
+
+    def test_lookup_result_can_be_mutated(self):
+        found = validator.lookup(self.english)
+        found["english"] = "mutated"
+        found["pos"] = "mutated"
+        again = validator.lookup(self.english)
+        self.assertEqual(again["english"], self.english)
+        self.assertEqual(again["pos"], self.entry["pos"])
+
+    def test_list_words_entries_can_be_mutated(self):
+        validator.list_words()[0]["english"] = "mutated"
+        self.assertEqual(validator.list_words()[0]["english"], self.english)
+        self.assertEqual(validator.lookup(self.english)["english"], self.english)
+
+
+if __name__ == "__main__":
+    unittest.main()
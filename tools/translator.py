@@ -10,13 +10,24 @@ Usage:
     python translator.py --interactive
 """
 
+import copy
 import json
+import os
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
+# orjson (optional) parses/serializes much faster; output is byte-identical
+# to json.dumps(indent=2, ensure_ascii=False)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ============================================================================
 # DICTIONARY & GRAMMAR DATA
 # ============================================================================
@@ -25,6 +36,9 @@ SCRIPT_DIR = Path(__file__).parent
 DICT_PATH = SCRIPT_DIR / "nyrakai-dictionary.json"
 SENTENCES_PATH = SCRIPT_DIR / "sentences.json"
 
+# Memoized (base, suffix) pairs in apply_interfix (pure, shared module-wide)
+INTERFIX_CACHE_SIZE = 8192
+
 # Load dictionary
 def load_dictionary() -> Dict:
     with open(DICT_PATH, 'r', encoding='utf-8') as f:
@@ -40,6 +54,9 @@ def build_lookups(data: Dict) -> Tuple[Dict, Dict]:
         eng = word['english'].lower()
         nyr = word['nyrakai']
         
+        # Gender variant notation (e.g., "fāri / fārā") - first form (masc/mixed) is primary
+        word['_nyrakai_primary'] = nyr.split(' / ')[0].strip() if ' / ' in nyr else nyr
+        
         # Handle multi-word English entries like "he/she/it"
         for variant in eng.replace('/', ' ').replace('(', ' ').replace(')', ' ').split():
             variant = variant.strip()
@@ -92,6 +109,15 @@ MOODS = {
     'conditional': 'wɒț',  # if/would
 }
 
+# Fixed suffixes used directly by the translator, resolved once
+GENITIVE_SUFFIX = CASES['genitive']
+VOCATIVE_SUFFIX = CASES['vocative']
+ABLATIVE_SUFFIX = CASES['ablative']
+ACCUSATIVE_SUFFIX = CASES['accusative']
+DEFAULT_ASPECT_SUFFIX = ASPECTS['ongoing']
+PASSIVE_SUFFIX = VOICES['passive']
+IMPERATIVE_SUFFIX = MOODS['imperative']
+
 # Pronouns mapping
 # Subject pronouns (can be subjects)
 SUBJECT_PRONOUNS = {'i', 'you', 'he', 'she', 'it', 'we', 'they'}
@@ -109,6 +135,16 @@ POSSESSIVE_DETERMINERS = {
     'their': 'šāri',
 }
 
+# Possessor (subject pronoun) → prefix, for "for the X he has done"
+POSSESSOR_PREFIXES = {
+    'he': 'šā',
+    'she': 'šā',
+    'it': 'šā',
+    'i': 'fā',
+    'you': 'gæ',
+    'we': 'fāri',
+}
+
 PRONOUNS = {
     'i': 'fā',
     'me': 'fā',
@@ -161,6 +197,15 @@ PREPOSITION_TO_CASE = {
     'of': 'genitive',          # -šar (possession)
 }
 
+# Preposition + up to 3 words, compiled once per preposition
+PREP_PHRASE_PATTERNS = tuple(
+    (prep, case, re.compile(rf'\b{prep}\s+((?:\w+\s*){{1,3}})', re.IGNORECASE))
+    for prep, case in PREPOSITION_TO_CASE.items()
+)
+
+# Word tokens inside a captured prepositional phrase
+PHRASE_TOKEN_RE = re.compile(r'\w+')
+
 # Contractions → expanded form (Nyrakai drops the copula anyway)
 CONTRACTIONS = {
     "we're": "we", "i'm": "i", "you're": "you", "they're": "they",
@@ -181,6 +226,12 @@ ADVERB_WORDS = {
     'where', 'when',  # question adverbs
 }
 
+# Quantifiers go with the subject, not with the other adjectives
+QUANTIFIERS = frozenset({'all', 'every', 'each', 'some', 'no', 'any', 'none'})
+
+# Words that end a prepositional phrase (adverbs and determiners)
+PREP_PHRASE_STOP_WORDS = frozenset(ADVERB_WORDS | QUANTIFIERS)
+
 # Particles (yes, no, etc.) - should be translated
 PARTICLE_WORDS = {'yes', 'no', 'please', 'okay', 'ok'}
 
@@ -193,15 +244,56 @@ CONJUNCTION_WORDS = {
     'if', 'when', 'before', 'after', 'until', 'unless',
 }
 
+# Word-order slots of a translated clause, front to back (OVSV)
+CLAUSE_SLOTS = (
+    'vocative', 'quantity', 'possessive_ablative', 'locative', 'instrumental',
+    'quoted', 'possessive_object', 'object', 'verb', 'adjectives', 'negation',
+    'subject', 'adverbs', 'question',
+)
+
+# Conjunctions that split compound sentences (in priority order) → Nyrakai
+CLAUSE_CONJUNCTIONS = {
+    'but': 'mur',
+    'and': 'əda',
+    'or': 'wɒ',
+    'then': 'țɒ',
+    'so': 'țɒ',  # use 'then' for 'so'
+}
+CLAUSE_CONJUNCTION_RE = re.compile(r'\b(' + '|'.join(CLAUSE_CONJUNCTIONS) + r')\b')
+
+# Speech verbs take their "adverbs" as quoted content (I said X)
+SPEECH_VERBS = frozenset({
+    'said', 'say', 'told', 'tell', 'asked', 'ask', 'shouted', 'shout',
+    'whispered', 'whisper', 'cried', 'cry', 'called', 'call', 'yelled', 'yell',
+})
+
+# Quotation marks deleted before parsing (apostrophes are kept for contractions)
+QUOTE_DELETE = str.maketrans('', '', '"`')
+
+# Aspect markers (checked in parse_english)
+# Substring markers are matched inside the lowercased original sentence
+MODAL_MARKERS = frozenset({'will', 'shall', 'going to', 'might', 'could', 'can'})
+PAST_AUX_MARKERS = frozenset({'did', 'was', 'were', 'had'})
+HABITUAL_MARKERS = frozenset({'always', 'usually', 'often'})
+# Irregular past tense verbs (matched as whole tokens)
+PAST_TENSE_IRREGULARS = frozenset({
+    'saw', 'ate', 'drank', 'gave', 'came', 'knew', 'heard',
+    'said', 'sat', 'stood', 'slept', 'swam', 'flew', 'died',
+    'killed', 'burned', 'burnt', 'lay', 'went', 'took', 'made',
+})
+
 # ============================================================================
 # INTERFIX RULES
 # ============================================================================
 
+# Vowel characters (includes the combining macron used by long diphthongs)
+NYRAKAI_VOWELS = frozenset('aeiouāēīōūæɒɛəœǣɒ̄ɛ̄ə̄œ̄')
+
 def is_vowel(char: str) -> bool:
     """Check if character is a Nyrakai vowel."""
-    vowels = set('aeiouāēīōūæɒɛəœǣɒ̄ɛ̄ə̄œ̄')
-    return char.lower() in vowels
+    return char.lower() in NYRAKAI_VOWELS
 
+@lru_cache(maxsize=INTERFIX_CACHE_SIZE)
 def apply_interfix(base: str, suffix: str) -> str:
     """Apply interfix rules for vowel collision."""
     if not base or not suffix:
@@ -227,15 +319,129 @@ def apply_feminine_bridge(root: str, suffix: str = 'ñī') -> str:
     
     return root + suffix
 
+# Every pronoun in every case, resolved once (closed class, so no per-call suffixing)
+PRONOUN_CASE_FORMS = {
+    (pronoun, case): apply_interfix(nyr, suffix)
+    for pronoun, nyr in PRONOUNS.items()
+    for case, suffix in CASES.items()
+}
+
+# ============================================================================
+# ENGLISH KEY TRIE
+# ============================================================================
+
+class EnglishTrie:
+    """
+    Character trie over the English lookup keys.
+    Supports prefix walks for "did you mean" suggestions on missing words.
+    """
+    _END = ''  # terminal marker (never a real character)
+
+    def __init__(self, words=()):
+        self._root = {}
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str):
+        node = self._root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[self._END] = True
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and self._END in node
+
+    def _find(self, prefix: str) -> Optional[Dict]:
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def longest_prefix(self, word: str) -> str:
+        """Longest prefix of `word` that is a path in the trie (not necessarily a key)."""
+        node = self._root
+        depth = 0
+        for ch in word:
+            node = node.get(ch)
+            if node is None:
+                break
+            depth += 1
+        return word[:depth]
+
+    def keys(self, prefix: str = '') -> List[str]:
+        """All keys starting with `prefix`, in sorted order."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        found = []
+        stack = [(prefix, node)]
+        while stack:
+            path, node = stack.pop()
+            for ch, child in node.items():
+                if ch == self._END:
+                    found.append(path)
+                else:
+                    stack.append((path + ch, child))
+        return sorted(found)
+
 # ============================================================================
 # TRANSLATION ENGINE
 # ============================================================================
 
 class NyrakaiTranslator:
+    __slots__ = ('_data', '_eng_to_nyr', '_nyr_to_entry', '_trie',
+                 'missing_words', '_lookup_cache', '_word_cache')
+
     def __init__(self):
-        self.data = load_dictionary()
-        self.eng_to_nyr, self.nyr_to_entry = build_lookups(self.data)
-        self.missing_words = []
+        # Dictionary and lookup tables are loaded on first use (see _ensure_loaded)
+        self._data = None
+        self._eng_to_nyr = None
+        self._nyr_to_entry = None
+        self._trie = None
+        self.missing_words = set()
+        self._lookup_cache = {}  # english (lowercased) → entry or None
+        self._word_cache = {}    # (english lowercased, case) → inflected nyrakai, found words only
+    
+    def reload_dictionary(self):
+        """Drop the loaded dictionary and every cache derived from it."""
+        self._data = None
+        self._eng_to_nyr = None
+        self._nyr_to_entry = None
+        self._trie = None
+        self._lookup_cache.clear()
+        self._word_cache.clear()
+    
+    def _ensure_loaded(self):
+        """Load the dictionary and build lookup tables if not done yet."""
+        if self._data is None:
+            data = load_dictionary()
+            self._eng_to_nyr, self._nyr_to_entry = build_lookups(data)
+            self._data = data
+    
+    @property
+    def data(self) -> Dict:
+        self._ensure_loaded()
+        return self._data
+    
+    @property
+    def eng_to_nyr(self) -> Dict:
+        self._ensure_loaded()
+        return self._eng_to_nyr
+    
+    @property
+    def nyr_to_entry(self) -> Dict:
+        self._ensure_loaded()
+        return self._nyr_to_entry
+    
+    @property
+    def trie(self) -> EnglishTrie:
+        # Only the "did you mean" suggestions need it, so build on first use
+        if self._trie is None:
+            self._trie = EnglishTrie(self.eng_to_nyr)
+        return self._trie
     
     # Irregular verb forms → base form
     IRREGULAR_VERBS = {
@@ -303,37 +509,55 @@ class NyrakaiTranslator:
     }
     
     def lookup(self, english: str) -> Optional[Dict]:
-        """Look up an English word in the dictionary."""
+        """Look up an English word in the dictionary (memoized per word)."""
         eng_lower = english.lower().strip()
+        if eng_lower not in self._lookup_cache:
+            self._lookup_cache[eng_lower] = self._lookup_uncached(eng_lower)
+        return self._lookup_cache[eng_lower]
+    
+    def _lookup_uncached(self, eng_lower: str) -> Optional[Dict]:
+        """Resolve a lowercased English word: exact, irregular, synonym, then suffix stripping."""
+        eng_to_nyr = self.eng_to_nyr
         
         # Try exact match first
-        if eng_lower in self.eng_to_nyr:
-            return self.eng_to_nyr[eng_lower]
+        if eng_lower in eng_to_nyr:
+            return eng_to_nyr[eng_lower]
         
         # Try irregular verb mapping
         if eng_lower in self.IRREGULAR_VERBS:
             base = self.IRREGULAR_VERBS[eng_lower]
-            if base in self.eng_to_nyr:
-                return self.eng_to_nyr[base]
+            if base in eng_to_nyr:
+                return eng_to_nyr[base]
         
         # Try synonym mapping
         if eng_lower in self.SYNONYMS:
             syn = self.SYNONYMS[eng_lower]
-            if syn in self.eng_to_nyr:
-                return self.eng_to_nyr[syn]
+            if syn in eng_to_nyr:
+                return eng_to_nyr[syn]
         
         # Try without common suffixes
         for suffix in ['ing', 'ed', 'es', 's', 'ly', 'er', 'est']:
             if eng_lower.endswith(suffix):
                 stem = eng_lower[:-len(suffix)]
-                if stem and stem in self.eng_to_nyr:
-                    return self.eng_to_nyr[stem]
+                if stem and stem in eng_to_nyr:
+                    return eng_to_nyr[stem]
                 # Try adding 'e' back (e.g., 'making' → 'make')
-                if stem + 'e' in self.eng_to_nyr:
-                    return self.eng_to_nyr[stem + 'e']
+                if stem + 'e' in eng_to_nyr:
+                    return eng_to_nyr[stem + 'e']
         
         return None
-    
+
+    def suggest(self, english: str, limit: int = 3) -> List[str]:
+        """Suggest dictionary keys sharing the longest known prefix ("did you mean")."""
+        eng_lower = english.lower().strip()
+        prefix = self.trie.longest_prefix(eng_lower)
+        # Too short a prefix matches half the dictionary - not a useful hint
+        if len(prefix) < 3:
+            return []
+        candidates = self.trie.keys(prefix)
+        candidates.sort(key=lambda k: abs(len(k) - len(eng_lower)))
+        return candidates[:limit]
+
     def get_pronoun(self, english: str) -> Optional[str]:
         """Get Nyrakai pronoun for English pronoun."""
         return PRONOUNS.get(english.lower())
@@ -347,7 +571,7 @@ class NyrakaiTranslator:
     
     def apply_aspect(self, verb: str, aspect: str = 'ongoing') -> str:
         """Apply aspect suffix to a verb with interfix if needed."""
-        suffix = ASPECTS.get(aspect, ASPECTS['ongoing'])
+        suffix = ASPECTS.get(aspect, DEFAULT_ASPECT_SUFFIX)
         return apply_interfix(verb, suffix)
     
     def apply_negation(self, verb: str) -> str:
@@ -382,7 +606,7 @@ class NyrakaiTranslator:
         
         # Remove quotation marks (but NOT apostrophes in contractions)
         # Only remove: " " " ' ' ` (curly quotes and backticks)
-        sentence = re.sub(r'["""`]', '', sentence)
+        sentence = sentence.translate(QUOTE_DELETE)
         
         # Expand contractions (We're → We, I'm → I, etc.)
         for contraction, expansion in CONTRACTIONS.items():
@@ -455,18 +679,15 @@ class NyrakaiTranslator:
             # Remove from sentence
             sentence = re.sub(possessive_pattern, '', sentence, count=1, flags=re.IGNORECASE).strip()
         
-        for prep, case in PREPOSITION_TO_CASE.items():
+        for prep, case, pattern in PREP_PHRASE_PATTERNS:
             # Match preposition + up to 3 words
-            pattern = rf'\b{prep}\s+((?:\w+\s*){{1,3}})'
-            match = re.search(pattern, sentence, re.IGNORECASE)
+            match = pattern.search(sentence)
             if match:
-                phrase = match.group(1).strip()
                 # Filter: skip grammar words, stop at adverbs/determiners
-                stop_words = ADVERB_WORDS | {'every', 'all', 'some', 'any', 'each', 'no', 'none'}
                 words = []
-                for w in phrase.split():
+                for w in PHRASE_TOKEN_RE.findall(match.group(1)):
                     w_lower = w.lower()
-                    if w_lower in stop_words:
+                    if w_lower in PREP_PHRASE_STOP_WORDS:
                         break  # Stop at adverbs and determiners
                     if w_lower not in GRAMMAR_WORDS:
                         words.append(w)  # Skip grammar words but continue
@@ -503,26 +724,24 @@ class NyrakaiTranslator:
         words = [w.strip('.,!?;:') for w in words if w.strip('.,!?;:')]
         result['raw_words'] = words
         
-        # Filter out grammar words (articles, auxiliaries)
+        # Filter out grammar words (articles, auxiliaries) and classify each
+        # content word once: (word, lowercase, dictionary pos or None if unknown)
         content_words = []
         for w in words:
             w_lower = w.lower()
             if w_lower not in GRAMMAR_WORDS:
-                content_words.append(w)
+                entry = self.lookup(w)
+                content_words.append((w, w_lower, entry.get('pos', '') if entry else None))
         
         # Simple SVO detection
         # Pattern: [Subject] [Verb] [Object]
         # But first check for imperatives (verb-first sentences)
         
-        pronouns_list = list(PRONOUNS.keys())
-        
         # Pre-scan: find first verb and first noun positions to detect imperatives
         first_verb_pos = None
         first_noun_pos = None
-        for i, word in enumerate(content_words):
-            entry = self.lookup(word)
-            if entry:
-                pos = entry.get('pos', '')
+        for i, (word, w_lower, pos) in enumerate(content_words):
+            if pos is not None:
                 if first_verb_pos is None and (pos == 'verb' or 'verb' in pos):
                     first_verb_pos = i
                 if first_noun_pos is None and pos in ['noun', 'proper noun']:
@@ -531,7 +750,7 @@ class NyrakaiTranslator:
         # Imperative detection: verb comes before any noun, and no pronoun subject
         is_imperative = (first_verb_pos is not None and 
                         (first_noun_pos is None or first_verb_pos < first_noun_pos) and
-                        not any(w.lower() in SUBJECT_PRONOUNS for w in content_words))
+                        not any(w_lower in SUBJECT_PRONOUNS for _, w_lower, _ in content_words))
         
         if is_imperative:
             result['mood'] = 'imperative'
@@ -539,8 +758,7 @@ class NyrakaiTranslator:
         # Find subject (usually first noun/pronoun - but only SUBJECT pronouns)
         # Skip subject detection for imperatives (subject is implied "you")
         if not is_imperative:
-            for i, word in enumerate(content_words):
-                w_lower = word.lower()
+            for i, (word, w_lower, pos) in enumerate(content_words):
                 # Skip words already used in prepositional phrases
                 if w_lower in result['prep_phrase_words']:
                     continue
@@ -552,21 +770,18 @@ class NyrakaiTranslator:
                 # Object pronouns are NOT subjects
                 elif w_lower in OBJECT_PRONOUNS:
                     continue  # Skip, will handle as object later
-                elif self.lookup(word):
-                    entry = self.lookup(word)
-                    if entry.get('pos') in ['noun', 'proper noun', 'pron']:
+                elif pos is not None:
+                    if pos in ['noun', 'proper noun', 'pron']:
                         result['subject'] = word
                         content_words = content_words[:i] + content_words[i+1:]
                         break
         
         # Find verb
         # First pass: look for clear verbs
-        for i, word in enumerate(content_words):
-            entry = self.lookup(word)
-            if entry:
-                pos = entry.get('pos', '')
+        for i, (word, w_lower, pos) in enumerate(content_words):
+            if pos is not None:
                 # Check if it's a verb (including 'adverb/verb' dual-class words)
-                if pos == 'verb' or (pos == 'adverb/verb' and word.lower() not in ADVERB_WORDS):
+                if pos == 'verb' or (pos == 'adverb/verb' and w_lower not in ADVERB_WORDS):
                     result['verb'] = word
                     content_words = content_words[:i] + content_words[i+1:]
                     break
@@ -581,20 +796,21 @@ class NyrakaiTranslator:
                     if entry and 'verb' in entry.get('pos', ''):
                         result['verb'] = base
                         # Remove from content_words if present
-                        content_words = [w for w in content_words if w.lower() != base]
+                        content_words = [t for t in content_words if t[1] != base]
                         break
         
         # Remaining content words are likely objects, adjectives, adverbs, or conjunctions
-        for word in content_words:
-            w_lower = word.lower()
-            
+        # (adverbs_lower mirrors result['adverbs'] for O(1) duplicate checks)
+        adverbs_lower = {a.lower() for a in result['adverbs']}
+        for word, w_lower, pos in content_words:
             # Check if it's an adverb we should translate
             # But skip if we already have a verb for this word (e.g., "agained" → "again" as verb)
-            if w_lower in ADVERB_WORDS and w_lower not in [a.lower() for a in result['adverbs']]:
+            if w_lower in ADVERB_WORDS and w_lower not in adverbs_lower:
                 # Don't add as adverb if it's the same as our detected verb
                 if result['verb'] and w_lower == result['verb'].lower():
                     continue
                 result['adverbs'].append(word)
+                adverbs_lower.add(w_lower)
                 continue
             
             # Check if it's a conjunction
@@ -610,15 +826,14 @@ class NyrakaiTranslator:
                     result['object'] = word
                 continue
             
-            entry = self.lookup(word)
-            if entry:
-                pos = entry.get('pos', '')
+            if pos is not None:
                 if pos == 'adj':
                     # Skip if word is already in a prepositional phrase
                     if w_lower not in result['prep_phrase_words']:
                         result['adjectives'].append(word)
                 elif pos == 'adverb':
                     result['adverbs'].append(word)
+                    adverbs_lower.add(w_lower)
                 elif pos == 'conjunction':
                     if 'conjunctions' not in result:
                         result['conjunctions'] = []
@@ -651,23 +866,18 @@ class NyrakaiTranslator:
         ]
         is_universal_truth = any(re.search(p, original_lower) for p in universal_truth_patterns)
         
-        # Check for irregular past tense verbs
-        past_tense_irregulars = ['saw', 'ate', 'drank', 'gave', 'came', 'knew', 'heard', 
-                                  'said', 'sat', 'stood', 'slept', 'swam', 'flew', 'died',
-                                  'killed', 'burned', 'burnt', 'lay', 'went', 'took', 'made']
-        
         if is_universal_truth:
             result['aspect'] = 'completed'  # Universal truths are "sealed/established"
-        elif any(w in original_lower for w in ['will', 'shall', 'going to', 'might', 'could', 'can']):
+        elif any(w in original_lower for w in MODAL_MARKERS):
             # Check modals FIRST (before -ed check, since "can be used" has "used")
             result['aspect'] = 'potential'
-        elif any(w in words_lower for w in past_tense_irregulars):
+        elif not PAST_TENSE_IRREGULARS.isdisjoint(words_lower):
             result['aspect'] = 'completed'
-        elif any(w in original_lower for w in ['did', 'was', 'were', 'had']):
+        elif any(w in original_lower for w in PAST_AUX_MARKERS):
             result['aspect'] = 'completed'
         elif any(w.endswith('ed') for w in words_lower):
             result['aspect'] = 'completed'
-        elif any(w in original_lower for w in ['always', 'usually', 'often']):
+        elif any(w in original_lower for w in HABITUAL_MARKERS):
             # 'every' alone doesn't trigger habitual (could be "every sometimes" = adverb phrase)
             result['aspect'] = 'habitual'
         else:
@@ -705,9 +915,7 @@ class NyrakaiTranslator:
         
         # Handle quoted speech: "I said X" where X (adverbs) is the quoted content
         # Speech verbs take their "adverbs" as the object (what was said)
-        speech_verbs = ['said', 'say', 'told', 'tell', 'asked', 'ask', 'shouted', 'shout',
-                        'whispered', 'whisper', 'cried', 'cry', 'called', 'call', 'yelled', 'yell']
-        if result['verb'] and result['verb'].lower() in speech_verbs:
+        if result['verb'] and result['verb'].lower() in SPEECH_VERBS:
             # If we have adverbs but no object, the adverbs are likely quoted content
             if result['adverbs'] and not result['object']:
                 # Convert adverbs to quoted object (join them as a phrase)
@@ -723,7 +931,14 @@ class NyrakaiTranslator:
         """
         eng_lower = english.lower()
         
+        cached = self._word_cache.get((eng_lower, case))
+        if cached is not None:
+            return cached, True
+        
         # Check pronouns first
+        pronoun_form = PRONOUN_CASE_FORMS.get((eng_lower, case))
+        if pronoun_form is not None:
+            return pronoun_form, True
         if eng_lower in PRONOUNS:
             nyr = PRONOUNS[eng_lower]
             return self.apply_case(nyr, case), True
@@ -731,14 +946,11 @@ class NyrakaiTranslator:
         # Look up in dictionary
         entry = self.lookup(english)
         if entry:
-            nyr = entry['nyrakai']
-            # Handle gender variant notation (e.g., "fāri / fārā") - use first (masc/mixed)
-            if ' / ' in nyr:
-                nyr = nyr.split(' / ')[0].strip()
-            return self.apply_case(nyr, case), True
+            nyr = self._word_cache[(eng_lower, case)] = self.apply_case(entry['_nyrakai_primary'], case)
+            return nyr, True
         
         # Word not found
-        self.missing_words.append(english)
+        self.missing_words.add(english)
         return f"[{english}?]", False
     
     def translate_compound(self, sentence: str) -> Dict:
@@ -764,7 +976,7 @@ class NyrakaiTranslator:
                 yes_word = yes_nyr['nyrakai']
                 no_word = no_nyr['nyrakai']
                 result['nyrakai'] = f"{result['nyrakai']}, {yes_word} wɒ {no_word}?"
-                result['breakdown'].append(f"yes or no → {yes_word} wɒ {no_word}")
+                self._add_step(result['breakdown'], result['glosses'], "yes or no", f"{yes_word} wɒ {no_word}")
             return result
         
         # Detect parallel predicate clauses: "X are ADJ1 and Y are ADJ2"
@@ -793,21 +1005,19 @@ class NyrakaiTranslator:
                 
                 # Check if there's a prefix clause (e.g., "It is true, ")
                 prefix = sentence[:parallel_pred_match.start()].strip().rstrip(',').strip()
+                breakdown = []
+                glosses = []
                 if prefix:
                     prefix_result = self.translate_single(prefix)
                     final_nyr = f"{prefix_result['nyrakai']}, {parallel_nyr}"
-                    breakdown = prefix_result['breakdown'] + ['---'] + [
-                        f"{subj1} are {adj1} → {adj1_nyr} {subj1_nyr} (predicate 1)",
-                        f"{subj2} are {adj2} → {adj2_nyr} {subj2_nyr} (predicate 2)",
-                        f"[and] → əda"
-                    ]
+                    breakdown.extend(prefix_result['breakdown'])
+                    breakdown.append('---')
+                    glosses.extend(prefix_result['glosses'])
                 else:
                     final_nyr = parallel_nyr
-                    breakdown = [
-                        f"{subj1} are {adj1} → {adj1_nyr} {subj1_nyr} (predicate 1)",
-                        f"{subj2} are {adj2} → {adj2_nyr} {subj2_nyr} (predicate 2)",
-                        f"[and] → əda"
-                    ]
+                self._add_step(breakdown, glosses, f"{subj1} are {adj1}", f"{adj1_nyr} {subj1_nyr}", "predicate 1")
+                self._add_step(breakdown, glosses, f"{subj2} are {adj2}", f"{adj2_nyr} {subj2_nyr}", "predicate 2")
+                self._add_step(breakdown, glosses, "[and]", "əda")
                 
                 return {
                     'input': sentence,
@@ -815,7 +1025,9 @@ class NyrakaiTranslator:
                     'nyrakai': final_nyr,
                     'literal': f"{adj1} {subj1} and {adj2} {subj2}",
                     'breakdown': breakdown,
+                    'glosses': glosses,
                     'missing_words': [],
+                    'suggestions': {},
                     'warnings': [],
                     'success': True,
                 }
@@ -837,22 +1049,15 @@ class NyrakaiTranslator:
                     'parsed': {'parallel_clauses': True},
                     'nyrakai': f"{result1['nyrakai']}, {result2['nyrakai']}",
                     'literal': f"{result1.get('literal', '')} // {result2.get('literal', '')}",
-                    'breakdown': result1['breakdown'] + ['---'] + result2['breakdown'],
-                    'missing_words': result1.get('missing_words', []) + result2.get('missing_words', []),
-                    'warnings': result1.get('warnings', []) + result2.get('warnings', []),
+                    'breakdown': [*result1['breakdown'], '---', *result2['breakdown']],
+                    'glosses': [*result1['glosses'], *result2['glosses']],
+                    'missing_words': [*result1.get('missing_words', []), *result2.get('missing_words', [])],
+                    'suggestions': {**result1.get('suggestions', {}), **result2.get('suggestions', {})},
+                    'warnings': [*result1.get('warnings', []), *result2.get('warnings', [])],
                     'success': result1.get('success', True) and result2.get('success', True),
                 }
                 return combined
         
-        # Conjunctions we handle
-        conjunction_map = {
-            'but': 'mur',
-            'and': 'əda',
-            'or': 'wɒ',
-            'then': 'țɒ',
-            'so': 'țɒ',  # use 'then' for 'so'
-        }
-        
         # Check if sentence contains a conjunction that splits clauses
         sentence_clean = sentence.strip().rstrip('?!.')
         sentence_lower = sentence_clean.lower()
@@ -860,43 +1065,23 @@ class NyrakaiTranslator:
         split_conj = None
         split_pos = -1
         
-        for conj in conjunction_map:
-            # Look for conjunction with word boundaries
-            pattern = rf'\b{conj}\b'
-            match = re.search(pattern, sentence_lower)
-            if match:
-                # Make sure it's not at the very start
-                if match.start() > 2:
-                    # Don't split on "and" if it's joining adjectives (X and Y before a verb)
-                    # or if it's inside a prepositional phrase (in X and Y)
-                    if conj == 'and':
-                        before = sentence_lower[:match.start()].strip()
-                        after = sentence_lower[match.end():].strip()
-                        
-                        # Check if "and" is joining adjectives (pattern: ADJ and ADJ ... VERB)
-                        # Skip if both sides look like single words (adjective pairs)
-                        before_words = before.split()
-                        after_words = after.split()
-                        
-                        # Skip if this looks like adjective joining (single word before "and")
-                        # and sentence contains verb after the conjunction
-                        if len(before_words) > 0 and len(after_words) > 0:
-                            # Check for "in X and Y" pattern (inside prepositional phrase)
-                            if before_words[-1] in ['in', 'on', 'at', 'with', 'by', 'from', 'to']:
-                                continue
-                            # Check for previous "in" indicating we're inside a PP
-                            if 'in ' in before and len(before.split('in ')[-1].split()) <= 2:
-                                continue
-                            # Check for adjective pairs: word AND word followed by noun/verb
-                            last_before = before_words[-1]
-                            first_after = after_words[0]
-                            # If the word after "and" is followed by "in" or end, likely adjective pair
-                            if len(after_words) >= 2 and after_words[1] == 'in':
-                                continue  # "free and equal in" - don't split
-                        
-                    split_conj = conj
-                    split_pos = match.start()
-                    break
+        # One scan for all conjunctions; keep the first occurrence of each
+        first_matches = {}
+        for match in CLAUSE_CONJUNCTION_RE.finditer(sentence_lower):
+            first_matches.setdefault(match.group(1), match)
+        
+        # Conjunctions are tried in priority order, not sentence order
+        for conj in CLAUSE_CONJUNCTIONS:
+            match = first_matches.get(conj)
+            # Make sure it's not at the very start
+            if match and match.start() > 2:
+                # Don't split on "and" if it's joining adjectives (X and Y before a verb)
+                # or if it's inside a prepositional phrase (in X and Y)
+                if conj == 'and' and self._and_joins_phrase(sentence_lower, match):
+                    continue
+                split_conj = conj
+                split_pos = match.start()
+                break
         
         if split_conj and split_pos > 0:
             # Split into two clauses
@@ -909,7 +1094,7 @@ class NyrakaiTranslator:
                 result2 = self.translate_single(clause2)
                 
                 # Get conjunction Nyrakai
-                conj_nyr = conjunction_map[split_conj]
+                conj_nyr = CLAUSE_CONJUNCTIONS[split_conj]
                 
                 # Combine results
                 combined = {
@@ -917,9 +1102,11 @@ class NyrakaiTranslator:
                     'parsed': {'compound': True, 'conjunction': split_conj},
                     'nyrakai': f"{result1['nyrakai']}, {conj_nyr} {result2['nyrakai']}",
                     'literal': f"{result1['literal']} {split_conj.upper()} {result2['literal']}",
-                    'breakdown': result1['breakdown'] + [f"[{split_conj}] → {conj_nyr} (conjunction)"] + result2['breakdown'],
-                    'missing_words': result1['missing_words'] + result2['missing_words'],
-                    'warnings': result1['warnings'] + result2['warnings'],
+                    'breakdown': [*result1['breakdown'], f"[{split_conj}] → {conj_nyr} (conjunction)", *result2['breakdown']],
+                    'glosses': [*result1['glosses'], (conj_nyr, f"[{split_conj}]", 'conjunction'), *result2['glosses']],
+                    'missing_words': [*result1['missing_words'], *result2['missing_words']],
+                    'suggestions': {**result1['suggestions'], **result2['suggestions']},
+                    'warnings': [*result1['warnings'], *result2['warnings']],
                     'success': result1['success'] and result2['success'],
                 }
                 return combined
@@ -927,6 +1114,58 @@ class NyrakaiTranslator:
         # No conjunction found, translate as single sentence
         return self.translate_single(sentence)
     
+    @staticmethod
+    def _and_joins_phrase(sentence_lower: str, match) -> bool:
+        """Check if an "and" match joins words inside a phrase rather than two clauses."""
+        before = sentence_lower[:match.start()].strip()
+        after = sentence_lower[match.end():].strip()
+        before_words = before.split()
+        after_words = after.split()
+        
+        if not before_words or not after_words:
+            return False
+        # Check for "in X and Y" pattern (inside prepositional phrase)
+        if before_words[-1] in ['in', 'on', 'at', 'with', 'by', 'from', 'to']:
+            return True
+        # Check for previous "in" indicating we're inside a PP
+        if 'in ' in before and len(before.split('in ')[-1].split()) <= 2:
+            return True
+        # If the word after "and" is followed by "in", likely adjective pair
+        # "free and equal in" - don't split
+        return len(after_words) >= 2 and after_words[1] == 'in'
+    
+    @staticmethod
+    def _add_step(breakdown: List[str], glosses: List[Tuple[str, str, str]],
+                  english: str, nyrakai: str, role: str = ''):
+        """Record a breakdown step as display text and as a (word, gloss, role) tuple."""
+        breakdown.append(f"{english} → {nyrakai} ({role})" if role else f"{english} → {nyrakai}")
+        glosses.append((nyrakai, english, role))
+    
+    def _render_verb(self, verb: str, verb_entry: Dict, negated: bool, voice: str,
+                     aspect: str, mood: str) -> Tuple[str, Tuple[str, str, str], List[Tuple[str, str, str]]]:
+        """
+        Build the full verb form (STEM + VOICE + ASPECT/MOOD) in one pass.
+        Returns (verb form, stem step, voice/aspect steps) as (english, nyrakai, role).
+        """
+        verb_stem = verb_entry['nyrakai']
+        if negated:
+            verb_stem = self.apply_negation(verb_stem)
+            stem_step = (verb, verb_stem, "verb, negated")
+        else:
+            stem_step = (verb, verb_stem, "verb stem")
+        
+        # For imperatives, use mood suffix instead of aspect
+        aspect_suffix = ASPECTS.get(aspect, DEFAULT_ASPECT_SUFFIX)
+        verb_suffix = IMPERATIVE_SUFFIX if mood == 'imperative' else aspect_suffix
+        # Apply voice first, then aspect/mood
+        verb_form = apply_interfix(verb_stem + VOICES.get(voice, ''), verb_suffix)
+        
+        aspect_steps = []
+        if voice == 'passive':
+            aspect_steps.append(("[passive]", PASSIVE_SUFFIX, "voice"))
+        aspect_steps.append((f"[{aspect}]", aspect_suffix, "aspect"))
+        return verb_form, stem_step, aspect_steps
+    
     def translate(self, sentence: str) -> Dict:
         """
         Main translation entry point.
@@ -939,9 +1178,17 @@ class NyrakaiTranslator:
         Translate a single English clause to Nyrakai.
         Returns detailed translation result.
         """
-        self.missing_words = []
+        self.missing_words = set()
         
         parsed = self.parse_english(sentence)
+        subject = parsed['subject']
+        verb = parsed['verb']
+        adjectives = parsed['adjectives']
+        negated = parsed['negated']
+        aspect = parsed['aspect']
+        voice = parsed.get('voice', 'active')
+        question = parsed['question']
+        verb_entry = self.lookup(verb) if verb else None
         
         result = {
             'input': sentence,
@@ -949,16 +1196,20 @@ class NyrakaiTranslator:
             'nyrakai': '',
             'literal': '',
             'breakdown': [],
+            'glosses': [],
             'missing_words': [],
+            'suggestions': {},
             'warnings': [],
             'success': True,
         }
         
         # Build Nyrakai sentence in OVSV order
         # [INST] + O (Object) + V+Asp (Verb+Aspect) + S (Subject) + [Adverbs]
+        # Each role fills its slot once; slots are joined in CLAUSE_SLOTS order
         
-        parts = []
+        slots = dict.fromkeys(CLAUSE_SLOTS, '')
         breakdown = []
+        glosses = []  # (word, gloss, role) per breakdown step
         adverb_parts = []  # Store adverbs for end of sentence
         adjective_parts = []  # Store adjectives for after verb
         
@@ -969,11 +1220,11 @@ class NyrakaiTranslator:
                 if adv_entry:
                     adv_nyr = adv_entry['nyrakai']
                     adverb_parts.append(adv_nyr)
-                    breakdown.append(f"{adv} → {adv_nyr} (adverb)")
+                    self._add_step(breakdown, glosses, adv, adv_nyr, "adverb")
                 else:
-                    self.missing_words.append(adv)
+                    self.missing_words.add(adv)
                     adverb_parts.append(f"[{adv}?]")
-                    breakdown.append(f"{adv} → [NOT FOUND] (adverb)")
+                    self._add_step(breakdown, glosses, adv, "[NOT FOUND]", "adverb")
         
         # 0a. Vocative phrase (O Mother!) - goes at VERY FRONT
         # "O Mother of the world" → ț'əngāršar țōți (genitive before vocative noun)
@@ -987,30 +1238,27 @@ class NyrakaiTranslator:
             for prep, words, case in parsed.get('prepositional_phrases', []):
                 if case == 'genitive' and prep == 'of':
                     # Translate genitive phrase and put it BEFORE vocative
-                    gen_words = []
-                    for w in words:
-                        w_nyr, _ = self.translate_word(w, 'nominative')
-                        gen_words.append(w_nyr)
-                    gen_suffix = CASES.get('genitive', 'šar')
+                    gen_words = [self.translate_word(w, 'nominative')[0] for w in words]
+                    gen_suffix = GENITIVE_SUFFIX
                     # Apply genitive to last word
                     gen_words[-1] = apply_interfix(gen_words[-1], gen_suffix)
                     genitive_part = ' '.join(gen_words)
-                    breakdown.append(f"of {' '.join(words)} → {genitive_part} (genitive, -{gen_suffix})")
+                    self._add_step(breakdown, glosses, f"of {' '.join(words)}", genitive_part, f"genitive, -{gen_suffix}")
                     # Remove this phrase from prepositional_phrases so it's not processed again
                     parsed['prepositional_phrases'] = [(p, w, c) for p, w, c in parsed['prepositional_phrases'] if not (p == 'of' and c == 'genitive')]
                     break
             
             # Apply vocative suffix -ți
-            voc_suffix = CASES.get('vocative', 'ți')
+            voc_suffix = VOCATIVE_SUFFIX
             voc_word = apply_interfix(noun_nyr, voc_suffix)
             
             # Build vocative phrase: [genitive] [vocative-noun]
             if genitive_part:
-                parts.append(f"{genitive_part} {voc_word}")
-                breakdown.append(f"O {voc_noun} → {voc_word} (vocative, -{voc_suffix})")
+                slots['vocative'] = f"{genitive_part} {voc_word}"
+                self._add_step(breakdown, glosses, f"O {voc_noun}", voc_word, f"vocative, -{voc_suffix}")
             else:
-                parts.append(voc_word)
-                breakdown.append(f"O {voc_noun} → {voc_word} (vocative, -{voc_suffix})")
+                slots['vocative'] = voc_word
+                self._add_step(breakdown, glosses, f"O {voc_noun}", voc_word, f"vocative, -{voc_suffix}")
         
         # 0b. Quantity question phrase (how many X) - goes at FRONT
         # "How many years" → kwōr ñœr hūț
@@ -1026,23 +1274,23 @@ class NyrakaiTranslator:
                 qq_parts.append(how_entry['nyrakai'])
             else:
                 qq_parts.append(f"[{qq['word']}?]")
-                self.missing_words.append(qq['word'])
+                self.missing_words.add(qq['word'])
             
             if adj_entry:
                 qq_parts.append(adj_entry['nyrakai'])
             else:
                 qq_parts.append(f"[{qq['adj']}?]")
-                self.missing_words.append(qq['adj'])
+                self.missing_words.add(qq['adj'])
             
             if noun_entry:
                 qq_parts.append(noun_entry['nyrakai'])
             else:
                 qq_parts.append(f"[{qq['noun']}?]")
-                self.missing_words.append(qq['noun'])
+                self.missing_words.add(qq['noun'])
             
             qq_str = ' '.join(qq_parts)
-            parts.append(qq_str)
-            breakdown.append(f"how {qq['adj']} {qq['noun']} → {qq_str} (quantity question)")
+            slots['quantity'] = qq_str
+            self._add_step(breakdown, glosses, f"how {qq['adj']} {qq['noun']}", qq_str, "quantity question")
         
         # 0b. Separate locative from instrumental phrases
         locative_phrases = []
@@ -1062,22 +1310,23 @@ class NyrakaiTranslator:
             possessor = poss_abl.get('possessor', 'he')
             
             # Get possessive prefix
-            poss_prefix = {'he': 'šā', 'she': 'šā', 'it': 'šā', 'i': 'fā', 'you': 'gæ', 'we': 'fāri'}.get(possessor.lower(), 'šā')
+            poss_prefix = POSSESSOR_PREFIXES.get(possessor.lower(), 'šā')
             
             # Translate noun
             noun_nyr, _ = self.translate_word(noun, 'nominative')
             
             # Apply possessive prefix + ablative suffix
-            ablative_suffix = CASES.get('ablative', 'ɒr')
+            ablative_suffix = ABLATIVE_SUFFIX
             poss_abl_word = poss_prefix + apply_interfix(noun_nyr, ablative_suffix)
             
-            parts.append(poss_abl_word)
-            breakdown.append(f"for {noun} {possessor}'s done → {poss_abl_word} (possessive + ablative)")
+            slots['possessive_ablative'] = poss_abl_word
+            self._add_step(breakdown, glosses, f"for {noun} {possessor}'s done", poss_abl_word, "possessive + ablative")
         
         # 0b. Locative phrases first (at VERY FRONT)
         # For locative, apply suffix to nouns only (adjectives don't get case)
         # "in dignity and rights" → "n'ærñorñen əda šōrænñen"
         # "on big rock" → "grōm zwūrñen" (adj + noun-LOC)
+        locative_strs = []
         for prep, words, case in locative_phrases:
             phrase_parts = []
             case_suffix = CASES.get(case, '')
@@ -1094,49 +1343,50 @@ class NyrakaiTranslator:
                     phrase_parts.append(word_nyr)
             if phrase_parts:
                 phrase_str = ' '.join(phrase_parts)
-                parts.append(phrase_str)
-                breakdown.append(f"{prep} {' '.join(words)} → {phrase_str} ({case}, -{case_suffix})")
+                locative_strs.append(phrase_str)
+                self._add_step(breakdown, glosses, f"{prep} {' '.join(words)}", phrase_str, f"{case}, -{case_suffix}")
+        slots['locative'] = ' '.join(locative_strs)
         
         # 0c. Instrumental phrases next
+        instrumental_strs = []
         for prep, words, case in instrumental_phrases:
-            phrase_parts = []
-            for word in words:
-                word_nyr, word_ok = self.translate_word(word, 'nominative')
-                phrase_parts.append(word_nyr)
+            phrase_parts = [self.translate_word(word, 'nominative')[0] for word in words]
             if phrase_parts:
                 last_word = phrase_parts[-1]
                 case_suffix = CASES.get(case, '')
                 phrase_parts[-1] = apply_interfix(last_word, case_suffix)
                 phrase_str = ' '.join(phrase_parts)
-                parts.append(phrase_str)
-                breakdown.append(f"{prep} {' '.join(words)} → {phrase_str} ({case}, -{case_suffix})")
+                instrumental_strs.append(phrase_str)
+                self._add_step(breakdown, glosses, f"{prep} {' '.join(words)}", phrase_str, f"{case}, -{case_suffix}")
+        slots['instrumental'] = ' '.join(instrumental_strs)
         
         # 1. Collect adjectives (will be placed AFTER verb)
         # First, identify quantifiers (they go with subject, not as regular adjectives)
-        quantifiers = ['all', 'every', 'each', 'some', 'no', 'any', 'none']
         quantifier = None
-        if parsed['adjectives']:
-            for adj in parsed['adjectives']:
-                if adj.lower() in quantifiers:
+        if adjectives:
+            for adj in adjectives:
+                if adj.lower() in QUANTIFIERS:
                     quantifier = adj
                 else:
                     adj_nyr, adj_ok = self.translate_word(adj)
                     adjective_parts.append(adj_nyr)
-                    breakdown.append(f"{adj} → {adj_nyr} (adj)")
+                    self._add_step(breakdown, glosses, adj, adj_nyr, "adj")
         
         # 1b. Quoted speech (if present) - placed as object
-        if parsed.get('quoted_speech'):
+        quoted_words = parsed.get('quoted_speech')
+        if quoted_words:
+            quoted_display = ' '.join(quoted_words)
             quoted_parts = []
-            for word in parsed['quoted_speech']:
+            for word in quoted_words:
                 word_entry = self.lookup(word)
                 if word_entry:
                     quoted_parts.append(word_entry['nyrakai'])
                 else:
-                    self.missing_words.append(word)
+                    self.missing_words.add(word)
                     quoted_parts.append(f"[{word}?]")
             quoted_str = ' '.join(quoted_parts)
-            parts.append(quoted_str)
-            breakdown.append(f"'{' '.join(parsed['quoted_speech'])}' → {quoted_str} (quoted speech)")
+            slots['quoted'] = quoted_str
+            self._add_step(breakdown, glosses, f"'{quoted_display}'", quoted_str, "quoted speech")
         
         # 1c. Possessive noun phrase: "my water" → fāna'ēraš (prefix + noun + accusative)
         if parsed.get('possessive_noun'):
@@ -1152,63 +1402,58 @@ class NyrakaiTranslator:
             
             # Combine: prefix + noun + accusative
             combined = poss_prefix + noun_nyr
-            acc_suffix = CASES.get('accusative', 'aš')
+            acc_suffix = ACCUSATIVE_SUFFIX
             combined_acc = apply_interfix(combined, acc_suffix)
             
-            parts.append(combined_acc)
-            breakdown.append(f"{det} {noun} → {combined_acc} (possessive + accusative)")
+            slots['possessive_object'] = combined_acc
+            self._add_step(breakdown, glosses, f"{det} {noun}", combined_acc, "possessive + accusative")
         
         # 1d. Object (accusative case) - skip "beings" if subject is "human"
         obj = parsed['object']
-        if obj and obj.lower() == 'beings' and parsed['subject'] and parsed['subject'].lower() == 'human':
+        if obj and obj.lower() == 'beings' and subject and subject.lower() == 'human':
             # "human beings" → just use "human" as subject, skip "beings" as object
             obj = None
         
         # Skip object if it's the same as subject (compound predicate adjective: "I'm X, I'm Y")
-        if obj and parsed['subject'] and obj.lower() == parsed['subject'].lower():
+        if obj and subject and obj.lower() == subject.lower():
             obj = None
         
         # For copula-less sentences (no verb, just subject + adjectives), 
         # don't treat anything as object
-        is_copula_less = not parsed['verb'] and parsed['adjectives']
+        is_copula_less = not verb and adjectives
         if is_copula_less:
             obj = None
         
         if obj:
             obj_nyr, obj_ok = self.translate_word(obj, 'accusative')
-            parts.append(obj_nyr)
-            breakdown.append(f"{obj} → {obj_nyr} (object, accusative)")
-        
-        # 2. Verb stem (with negation if needed)
-        if parsed['verb']:
-            verb_entry = self.lookup(parsed['verb'])
-            if verb_entry:
-                verb_stem = verb_entry['nyrakai']
-                if parsed['negated']:
-                    verb_stem = self.apply_negation(verb_stem)
-                    breakdown.append(f"{parsed['verb']} → za{verb_entry['nyrakai']} (verb, negated)")
-                else:
-                    breakdown.append(f"{parsed['verb']} → {verb_stem} (verb stem)")
-                parts.append(verb_stem)
-            else:
-                self.missing_words.append(parsed['verb'])
-                parts.append(f"[{parsed['verb']}?]")
-                breakdown.append(f"{parsed['verb']} → [NOT FOUND]")
+            slots['object'] = obj_nyr
+            self._add_step(breakdown, glosses, obj, obj_nyr, "object, accusative")
+        
+        # 2. Verb stem (with negation if needed) + voice + aspect/mood
+        aspect_steps = []
+        if verb_entry:
+            slots['verb'], stem_step, aspect_steps = self._render_verb(
+                verb, verb_entry, negated, voice, aspect, parsed.get('mood'))
+            self._add_step(breakdown, glosses, *stem_step)
+        elif verb:
+            self.missing_words.add(verb)
+            slots['verb'] = f"[{verb}?]"
+            self._add_step(breakdown, glosses, verb, "[NOT FOUND]")
         
         # 2b. Adjectives (after verb, or as predicate if no verb)
         # For copula-less sentences, adjectives are the main predicate
         if adjective_parts:
             if len(adjective_parts) > 1:
-                parts.append(' əda '.join(adjective_parts))
+                slots['adjectives'] = ' əda '.join(adjective_parts)
                 breakdown.append("(adjectives joined with əda)")
             else:
-                parts.extend(adjective_parts)
+                slots['adjectives'] = adjective_parts[0]
         
         # 2c. Add negation for copula-less sentences (I am NOT X)
         # If negated but no verb, add 'zæ' (not) after adjectives
-        if is_copula_less and parsed['negated']:
-            parts.append('zæ')
-            breakdown.append("[not] → zæ (negation)")
+        if is_copula_less and negated:
+            slots['negation'] = 'zæ'
+            self._add_step(breakdown, glosses, "[not]", "zæ", "negation")
         
         # 3. Quantifier + Subject (nominative - unmarked)
         # quantifier was already extracted in step 1
@@ -1219,109 +1464,48 @@ class NyrakaiTranslator:
             noun_nyr, _ = self.translate_word(mn['noun'], 'nominative')
             if mod_entry:
                 mod_nyr = mod_entry['nyrakai']
-                parts.append(f"{mod_nyr} {noun_nyr}")
-                breakdown.append(f"{mn['noun']} {mn['modifier']} → {mod_nyr} {noun_nyr} (modified subject)")
+                slots['subject'] = f"{mod_nyr} {noun_nyr}"
+                self._add_step(breakdown, glosses, f"{mn['noun']} {mn['modifier']}", f"{mod_nyr} {noun_nyr}", "modified subject")
             else:
-                parts.append(noun_nyr)
-                self.missing_words.append(mn['modifier'])
-        elif parsed['subject']:
-            subj_nyr, subj_ok = self.translate_word(parsed['subject'], 'nominative')
+                slots['subject'] = noun_nyr
+                self.missing_words.add(mn['modifier'])
+        elif subject:
+            subj_nyr, subj_ok = self.translate_word(subject, 'nominative')
             if quantifier:
                 quant_nyr, _ = self.translate_word(quantifier)
-                parts.append(f"{quant_nyr} {subj_nyr}")
-                breakdown.append(f"{quantifier} {parsed['subject']} → {quant_nyr} {subj_nyr} (quantifier + subject)")
+                slots['subject'] = f"{quant_nyr} {subj_nyr}"
+                self._add_step(breakdown, glosses, f"{quantifier} {subject}", f"{quant_nyr} {subj_nyr}", "quantifier + subject")
             else:
-                parts.append(subj_nyr)
-                breakdown.append(f"{parsed['subject']} → {subj_nyr} (subject)")
-        
-        # 4. Verb voice and aspect
-        if parsed['verb']:
-            verb_entry = self.lookup(parsed['verb'])
-            if verb_entry:
-                # Add voice if passive
-                if parsed.get('voice') == 'passive':
-                    voice_suffix = VOICES.get('passive', 'rōn')
-                    breakdown.append(f"[passive] → {voice_suffix} (voice)")
-                
-                aspect_suffix = ASPECTS.get(parsed['aspect'], ASPECTS['ongoing'])
-                parts.append(aspect_suffix)
-                breakdown.append(f"[{parsed['aspect']}] → {aspect_suffix} (aspect)")
-        
-        # 5. Question particle - added later (after adverbs) in final assembly
-        if parsed['question']:
-            # Don't add here - will be added at the very end after adverbs
-            breakdown.append(f"[question] → ka (particle)")
-        
-        # Build final sentence
-        # Filter empty parts
-        parts = [p for p in parts if p]
-        
-        # Combine verb stem + aspect into one unit
-        # Restructure: [O] [za-V] [S] [aspect] [ka?]
-        # Actually in Nyrakai the aspect attaches to verb
-        
-        # Rebuild properly
-        final_parts = []
-        verb_with_aspect = None
-        
-        for i, p in enumerate(parts):
-            # Check if this is an aspect suffix
-            if p in ASPECTS.values():
-                continue  # Skip, we'll attach to verb
-            final_parts.append(p)
-        
-        # Attach aspect to verb
-        if parsed['verb'] and self.lookup(parsed['verb']):
-            verb_idx = None
-            verb_entry = self.lookup(parsed['verb'])
-            verb_form = verb_entry['nyrakai']
-            if parsed['negated']:
-                verb_form = 'za' + verb_form
-            
-            for i, p in enumerate(final_parts):
-                if p == verb_form or p == 'za' + verb_entry['nyrakai']:
-                    verb_idx = i
-                    break
-            
-            if verb_idx is not None:
-                # Build verb: VERB + VOICE + ASPECT/MOOD
-                voice_suffix = VOICES.get(parsed.get('voice', 'active'), '')
-                
-                # For imperatives, use mood suffix instead of aspect
-                if parsed.get('mood') == 'imperative':
-                    verb_suffix = MOODS.get('imperative', 'țiræ')
-                    suffix_type = 'imperative'
-                else:
-                    verb_suffix = ASPECTS.get(parsed['aspect'], ASPECTS['ongoing'])
-                    suffix_type = parsed['aspect']
-                
-                # Apply voice first, then aspect/mood
-                verb_with_voice = verb_form + voice_suffix if voice_suffix else verb_form
-                final_parts[verb_idx] = apply_interfix(verb_with_voice, verb_suffix)
+                slots['subject'] = subj_nyr
+                self._add_step(breakdown, glosses, subject, subj_nyr, "subject")
         
-        # Add adverbs at end (after subject, before question particle)
-        if adverb_parts:
-            final_parts.extend(adverb_parts)
+        # 4. Verb voice and aspect (already attached to the verb in step 2)
+        for step in aspect_steps:
+            self._add_step(breakdown, glosses, *step)
         
-        # Add question particle at end
-        if parsed['question'] and 'ka' not in final_parts:
-            final_parts.append('ka')
+        # 5. Adverbs at end (after subject, before question particle)
+        slots['adverbs'] = ' '.join(adverb_parts)
         
-        result['nyrakai'] = ' '.join(final_parts)
+        # 6. Question particle at the very end
+        if question:
+            slots['question'] = 'ka'
+            self._add_step(breakdown, glosses, "[question]", "ka", "particle")
+        
+        result['nyrakai'] = ' '.join(part for part in slots.values() if part)
         result['breakdown'] = breakdown
-        result['missing_words'] = list(set(self.missing_words))
+        result['glosses'] = glosses
+        result['missing_words'] = sorted(self.missing_words)
         
         if self.missing_words:
             result['success'] = False
-            result['warnings'].append(f"Missing vocabulary: {', '.join(set(self.missing_words))}")
+            result['warnings'].append(f"Missing vocabulary: {', '.join(result['missing_words'])}")
+            for word in result['missing_words']:
+                hints = self.suggest(word)
+                if hints:
+                    result['suggestions'][word] = hints
         
-        # Generate literal back-translation
-        literal_parts = []
-        for b in breakdown:
-            if '→' in b:
-                eng = b.split('→')[0].strip()
-                literal_parts.append(eng)
-        result['literal'] = ' '.join(literal_parts)
+        # Literal back-translation: the English side of each step
+        result['literal'] = ' '.join(gloss for _, gloss, _ in glosses)
         
         return result
 
@@ -1329,11 +1513,35 @@ class NyrakaiTranslator:
 # SENTENCE STORAGE
 # ============================================================================
 
+def loads_json(raw: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def dumps_json(data, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept readable), indented or compact."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Parsed sentences.json keyed by its (mtime, size) stamp, reused until the file changes
+_sentences_cache: Optional[Tuple[Tuple[int, int], Dict]] = None
+
+def _sentences_stamp() -> Tuple[int, int]:
+    st = SENTENCES_PATH.stat()
+    return (st.st_mtime_ns, st.st_size)
+
 def load_sentences() -> Dict:
-    """Load sentences database."""
+    """Load sentences database (parsed once per file change, returned as a copy)."""
+    global _sentences_cache
     if SENTENCES_PATH.exists():
-        with open(SENTENCES_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        stamp = _sentences_stamp()
+        if _sentences_cache is None or _sentences_cache[0] != stamp:
+            _sentences_cache = (stamp, loads_json(SENTENCES_PATH.read_bytes()))
+        return copy.deepcopy(_sentences_cache[1])
     return {
         "meta": {
             "language": "Nyrakai",
@@ -1341,6 +1549,7 @@ def load_sentences() -> Dict:
             "created": datetime.now().strftime("%Y-%m-%d"),
             "updated": datetime.now().strftime("%Y-%m-%d"),
             "total_sentences": 0,
+            "next_id": 1,
             "categories": ["motto", "greeting", "dialogue", "narrative", "ritual", "proverb"]
         },
         "sentences": []
@@ -1348,29 +1557,23 @@ def load_sentences() -> Dict:
 
 def save_sentence(result: Dict, category: str = "dialogue", context: str = "", register: str = "everyday") -> bool:
     """Save an approved translation to sentences.json."""
+    global _sentences_cache
     if not result.get('success'):
         print("❌ Cannot save: translation has missing words")
         return False
     
     data = load_sentences()
     
-    # Generate next ID
-    next_id = max([s.get('id', 0) for s in data['sentences']], default=0) + 1
+    # Generate next ID (files saved before next_id was tracked fall back to a scan)
+    next_id = data['meta'].get('next_id')
+    if next_id is None:
+        next_id = max((s.get('id', 0) for s in data['sentences']), default=0) + 1
     
-    # Build breakdown from result
-    breakdown = []
-    for step in result.get('breakdown', []):
-        if '→' in step:
-            parts = step.split('→')
-            eng = parts[0].strip()
-            rest = parts[1].strip()
-            nyr = rest.split('(')[0].strip()
-            role = rest.split('(')[1].rstrip(')') if '(' in rest else ''
-            breakdown.append({
-                "word": nyr,
-                "gloss": eng,
-                "role": role
-            })
+    # Build breakdown from the result's (word, gloss, role) steps
+    breakdown = [
+        {"word": word, "gloss": gloss, "role": role}
+        for word, gloss, role in result.get('glosses', [])
+    ]
     
     sentence = {
         "id": next_id,
@@ -1389,14 +1592,26 @@ def save_sentence(result: Dict, category: str = "dialogue", context: str = "", r
     
     data['sentences'].append(sentence)
     data['meta']['total_sentences'] = len(data['sentences'])
+    data['meta']['next_id'] = next_id + 1
     data['meta']['updated'] = datetime.now().strftime("%Y-%m-%d")
     
-    with open(SENTENCES_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Indented by default so the checked-in file diffs cleanly; NYRAKAI_PRETTY=0/false/no writes compact JSON
+    pretty = os.environ.get('NYRAKAI_PRETTY', '').strip().lower() not in ('0', 'false', 'no')
+    SENTENCES_PATH.write_bytes(dumps_json(data, pretty=pretty))
+    _sentences_cache = (_sentences_stamp(), data)
     
     print(f"✅ Saved sentence #{next_id} to sentences.json")
     return True
 
+def format_sentences() -> bool:
+    """Rewrite sentences.json with indentation for human reading."""
+    if not SENTENCES_PATH.exists():
+        print("❌ No sentences.json to format")
+        return False
+    SENTENCES_PATH.write_bytes(dumps_json(load_sentences()))
+    print("✅ Pretty-printed sentences.json")
+    return True
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -1422,6 +1637,8 @@ def print_result(result: Dict):
         print()
         print(f"❌ Missing words: {', '.join(result['missing_words'])}")
         print("   (These words need to be added to the dictionary)")
+        for word, hints in result.get('suggestions', {}).items():
+            print(f"   {word}: did you mean {', '.join(hints)}?")
     
     if result['warnings']:
         print()
@@ -1465,48 +1682,53 @@ def validate_all_sentences(translator):
     # Categories to skip (special structures that translator doesn't handle)
     skip_categories = {'motto'}  # Add more if needed: 'ritual', etc.
     
-    print('=' * 70)
-    print('TRANSLATOR VALIDATION: All Stored Sentences')
-    print('=' * 70)
+    # Report is collected and written once at the end
+    lines = [
+        '=' * 70,
+        'TRANSLATOR VALIDATION: All Stored Sentences',
+        '=' * 70,
+    ]
     
     matches = 0
     skipped = 0
     total = len(data['sentences'])
+    generated_by_english = {}  # each distinct English sentence is translated once
     
     for s in data['sentences']:
         english = s['english']
         stored = s['nyrakai']
         category = s.get('category', 'dialogue')
+        eng_display = english[:40] + '...' if len(english) > 40 else english
         
         # Skip special categories
         if category in skip_categories:
-            eng_display = english[:40] + '...' if len(english) > 40 else english
-            print(f"#{s['id']} ⏭️  {eng_display}")
-            print(f"   (skipped: {category} - special structure)")
+            lines.append(f"#{s['id']} ⏭️  {eng_display}")
+            lines.append(f"   (skipped: {category} - special structure)")
             skipped += 1
             continue
         
         # Translate
-        result = translator.translate(english)
-        generated = result.get('nyrakai', '')
+        if english not in generated_by_english:
+            generated_by_english[english] = translator.translate(english).get('nyrakai', '')
+        generated = generated_by_english[english]
         
         match = '✅' if generated == stored else '❌'
         if generated == stored:
             matches += 1
         
-        eng_display = english[:40] + '...' if len(english) > 40 else english
-        print(f"#{s['id']} {match} {eng_display}")
+        lines.append(f"#{s['id']} {match} {eng_display}")
         if generated != stored:
-            print(f"   Stored:    {stored}")
-            print(f"   Generated: {generated}")
+            lines.append(f"   Stored:    {stored}")
+            lines.append(f"   Generated: {generated}")
     
     validated = total - skipped
-    print()
-    print('=' * 70)
-    print(f"🎯 SCORE: {matches}/{validated} validated sentences match")
+    lines.append('')
+    lines.append('=' * 70)
+    lines.append(f"🎯 SCORE: {matches}/{validated} validated sentences match")
     if skipped:
-        print(f"   ({skipped} skipped: special structure)")
-    print('=' * 70)
+        lines.append(f"   ({skipped} skipped: special structure)")
+    lines.append('=' * 70)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
@@ -1517,11 +1739,13 @@ def main():
         print("       python translator.py --interactive")
         print("       python translator.py --save \"English sentence\"")
         print("       python translator.py --validate")
+        print("       python translator.py --format")
         print()
         print("Options:")
         print("  --interactive, -i    Interactive translation mode")
         print("  --save, -s           Save approved translation to sentences.json")
         print("  --validate, -v       Validate against all stored sentences")
+        print("  --format, -f         Pretty-print sentences.json")
         print()
         print("Examples:")
         print("  python translator.py \"I see the star\"")
@@ -1533,6 +1757,7 @@ def main():
     save_mode = False
     interactive_mode_flag = False
     validate_mode = False
+    format_mode = False
     sentence_parts = []
     
     i = 1
@@ -1544,11 +1769,15 @@ def main():
             save_mode = True
         elif arg in ['--validate', '-v']:
             validate_mode = True
+        elif arg in ['--format', '-f']:
+            format_mode = True
         else:
             sentence_parts.append(arg)
         i += 1
     
-    if validate_mode:
+    if format_mode:
+        format_sentences()
+    elif validate_mode:
         validate_all_sentences(translator)
     elif interactive_mode_flag:
         interactive_mode(translator)
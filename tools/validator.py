@@ -8,6 +8,9 @@ Includes Sound Map domain validation.
 
 import json
 import re
+import sys
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
 # Import sound map for domain validation
@@ -17,18 +20,47 @@ try:
 except ImportError:
     SOUND_MAP_AVAILABLE = False
 
+# orjson (optional) parses/serializes the dictionary much faster; its indented
+# output is byte-identical to json.dump(indent=2, ensure_ascii=False)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# rapidfuzz (optional) provides C Levenshtein/Indel distances for the similarity checks
+try:
+    from rapidfuzz.distance import Indel, Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# rapidfuzz's cdist (needs numpy) computes the all-pairs distance matrix in C
+try:
+    import numpy as np
+    from rapidfuzz.process import cdist
+    CDIST_AVAILABLE = True
+except ImportError:
+    CDIST_AVAILABLE = False
+
+
+def _interned(phonemes) -> frozenset:
+    """Build a phoneme set from interned strings (tokenize() interns its tokens too)."""
+    return frozenset(sys.intern(p) for p in phonemes)
+
+
 # Nyrakai Alphabet
-CONSONANTS = set('dfghklmnñprst') | {'ț', 'z'}
-VOWELS_SHORT = set('aeiou')
-VOWELS_LONG = {'ā', 'ē', 'ī', 'ō', 'ū'}
+CONSONANTS = _interned(set('dfghklmnñprst') | {'ț', 'z'})
+VOWELS_SHORT = _interned('aeiou')
+VOWELS_LONG = _interned({'ā', 'ē', 'ī', 'ō', 'ū'})
 VOWELS = VOWELS_SHORT | VOWELS_LONG
-GLIDES = {'w', 'y'}
-EJECTIVES = {"k^", "p^", "t^"}
-AFFRICATES = {'ƨ', 'š', 'ƶ', 'ŧ'}  # ts, tch, dz, tr
-DIPHTHONGS_SHORT = {'æ', 'ɒ', 'ɛ', 'ə', 'œ'}  # ai, au, ei, eu, oi
-DIPHTHONGS_LONG = {'ǣ'}  # āi (precomposed)
+GLIDES = _interned({'w', 'y'})
+EJECTIVES = _interned({"k^", "p^", "t^"})
+AFFRICATES = _interned({'ƨ', 'š', 'ƶ', 'ŧ'})  # ts, tch, dz, tr
+DIPHTHONGS_SHORT = _interned({'æ', 'ɒ', 'ɛ', 'ə', 'œ'})  # ai, au, ei, eu, oi
+DIPHTHONGS_LONG = _interned({'ǣ'})  # āi (precomposed)
 # These use combining macron (0x304) and need special handling:
-DIPHTHONGS_LONG_COMBINING = {'ɒ̄', 'ɛ̄', 'ə̄', 'œ̄'}  # āu, ēi, ēu, ōi
+DIPHTHONGS_LONG_COMBINING = _interned({'ɒ̄', 'ɛ̄', 'ə̄', 'œ̄'})  # āu, ēi, ēu, ōi
 DIPHTHONGS_LONG = DIPHTHONGS_LONG | DIPHTHONGS_LONG_COMBINING
 DIPHTHONGS = DIPHTHONGS_SHORT | DIPHTHONGS_LONG
 
@@ -38,9 +70,16 @@ DIPHTHONGS = DIPHTHONGS_SHORT | DIPHTHONGS_LONG
 GLOTTAL_MARKER = "'"
 
 ALL_VOWELS = VOWELS | DIPHTHONGS
-ALL_CONSONANTS = CONSONANTS | GLIDES | AFFRICATES | set(EJECTIVES)
+ALL_CONSONANTS = CONSONANTS | GLIDES | AFFRICATES | EJECTIVES
 # Note: ' is NOT in ALL_CONSONANTS - it's handled specially
 
+# Glottal-modified vowels ('V) - a glottal marker plus a single-letter vowel
+GLOTTAL_VOWELS = frozenset(sys.intern(GLOTTAL_MARKER + v) for v in ALL_VOWELS if len(v) == 1)
+# Everything that counts as a syllable nucleus (see is_vowel)
+NUCLEUS_PHONEMES = ALL_VOWELS | GLOTTAL_VOWELS
+# Every token validate_word accepts
+VALID_PHONEMES = ALL_CONSONANTS | NUCLEUS_PHONEMES | {GLOTTAL_MARKER}
+
 # Exclusion rules
 ONSET_C1_EXCLUDED = {GLOTTAL_MARKER}  # ' cannot start syllable
 ONSET_C2_EXCLUDED = {"p'", "k'", "t'", 'š', 'ƨ', 'ñ'}  # these cannot be second consonant in cluster
@@ -129,14 +168,109 @@ CATEGORY_TO_DOMAINS = {
 }
 
 DICT_PATH = Path(__file__).parent / "nyrakai-dictionary.json"
+# Append-only sidecar for bulk add_word(journal=True); folded back by compact()
+JOURNAL_PATH = DICT_PATH.with_suffix(".jsonl")
+
+# Memoized results of normalize/tokenize/validate_word (pure per input string)
+WORD_CACHE_SIZE = 4096
+
+# Parsed dictionary plus entry-position indexes, reloaded only when the file changes
+# (the similarity trie and collision indexes are built lazily and dropped
+# whenever an entry is indexed)
+_DICT_CACHE = {"stamp": None, "data": None, "by_nyrakai": {}, "by_english": {},
+               "trie": None, "collision": None}
+
+
+def _dict_stamp() -> tuple:
+    """Identify the current dictionary version (path, mtime, size, journal)."""
+    st = DICT_PATH.stat()
+    try:
+        jst = JOURNAL_PATH.stat()
+        journal = (jst.st_mtime_ns, jst.st_size)
+    except FileNotFoundError:
+        journal = None
+    return (str(DICT_PATH), st.st_mtime_ns, st.st_size, journal)
+
+
+def _index_entry(position: int, entry: dict):
+    """Record an entry's position under its Nyrakai form and lowercase English."""
+    _DICT_CACHE["trie"] = _DICT_CACHE["collision"] = None
+    _DICT_CACHE["by_nyrakai"].setdefault(entry.get("nyrakai", ""), []).append(position)
+    _DICT_CACHE["by_english"].setdefault(entry.get("english", "").lower(), []).append(position)
+
+
+def _load_dict() -> dict:
+    """
+    Return the parsed dictionary, re-reading DICT_PATH only when its
+    mtime/size changes. The result is shared - treat it as read-only.
+    """
+    stamp = _dict_stamp()
+    if _DICT_CACHE["stamp"] != stamp:
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        data = loads(DICT_PATH.read_bytes())
+        # Merge journaled entries (one JSON object per line) after the base
+        if stamp[3] is not None:
+            journaled = [loads(line) for line in JOURNAL_PATH.read_bytes().splitlines() if line.strip()]
+            if journaled:
+                data.setdefault("words", []).extend(journaled)
+                data.setdefault("meta", {})["total_words"] = len(data["words"])
+        # word -> positions in data["words"] (in file order)
+        _DICT_CACHE.update(stamp=stamp, data=data, by_nyrakai={}, by_english={},
+                           trie=None, collision=None)
+        for i, w in enumerate(data.get("words", [])):
+            _index_entry(i, w)
+    return _DICT_CACHE["data"]
+
+
+def _invalidate_dict_cache():
+    """Force the next _load_dict() to re-read the file."""
+    _DICT_CACHE["stamp"] = None
+
+
+def _write_dict(dictionary: dict):
+    """Rewrite DICT_PATH in full and drop the (now folded-in) journal."""
+    if ORJSON_AVAILABLE:
+        DICT_PATH.write_bytes(orjson.dumps(dictionary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(DICT_PATH, 'w') as f:
+            json.dump(dictionary, f, indent=2, ensure_ascii=False)
+    if JOURNAL_PATH.exists():
+        JOURNAL_PATH.unlink()
+
+
+def compact() -> int:
+    """
+    Fold journaled add_word entries into DICT_PATH.
+    Returns the number of entries that were folded in.
+    """
+    if not JOURNAL_PATH.exists():
+        return 0
+    folded = sum(1 for line in JOURNAL_PATH.read_bytes().splitlines() if line.strip())
+    dictionary = _load_dict()
+    try:
+        _write_dict(dictionary)
+    finally:
+        _invalidate_dict_cache()
+    return folded
+
+
+# Gender variant notation in the nyrakai field (e.g. "fāri / fārā")
+VARIANT_SEP = " / "
+
+
+def _split_variants(nyrakai: str) -> list:
+    """Variants of a dictionary form (a one-item list when it has none)."""
+    if VARIANT_SEP not in nyrakai:
+        return [nyrakai]
+    return [v.strip() for v in nyrakai.split(VARIANT_SEP)]
+
 
 def load_dictionary_words() -> dict:
     """Load dictionary and return lookup dicts."""
     if not DICT_PATH.exists():
         return {}, {}
     try:
-        with open(DICT_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_dict()
         nyr_to_eng = {}
         eng_to_nyr = {}
         for entry in data.get('words', []):
@@ -144,8 +278,8 @@ def load_dictionary_words() -> dict:
             eng = entry.get('english', '')
             
             # Handle gender variant notation (e.g., "fāri / fārā")
-            if ' / ' in nyr:
-                variants = [v.strip() for v in nyr.split(' / ')]
+            variants = _split_variants(nyr)
+            if len(variants) > 1:
                 for variant in variants:
                     nyr_to_eng[variant] = eng
                     nyr_to_eng[variant.lower()] = eng
@@ -157,10 +291,7 @@ def load_dictionary_words() -> dict:
             
             if eng:
                 # Store first variant as default for eng→nyr lookup
-                if ' / ' in nyr:
-                    eng_to_nyr[eng.lower()] = nyr.split(' / ')[0].strip()
-                else:
-                    eng_to_nyr[eng.lower()] = nyr
+                eng_to_nyr[eng.lower()] = variants[0]
         return nyr_to_eng, eng_to_nyr
     except:
         return {}, {}
@@ -172,8 +303,9 @@ def word_exists_in_dictionary(nyrakai: str) -> tuple:
     """Check if a Nyrakai word exists in dictionary. Returns (exists, english_meaning)."""
     if nyrakai in _NYR_TO_ENG:
         return True, _NYR_TO_ENG[nyrakai]
-    if nyrakai.lower() in _NYR_TO_ENG:
-        return True, _NYR_TO_ENG[nyrakai.lower()]
+    lowered = nyrakai.lower()
+    if lowered in _NYR_TO_ENG:
+        return True, _NYR_TO_ENG[lowered]
     return False, None
 
 # Diphthong conversion map (digraph → single letter)
@@ -209,76 +341,76 @@ AFFRICATE_MAP = {
 }
 
 
+def _build_normalize_pattern() -> tuple:
+    """
+    Fold the affricate, long-vowel and diphthong passes into one regex.
+    Long vowels are converted BEFORE diphthongs, so:
+      - a doubled vowel + glide cascades into a long diphthong (aai → āi → ǣ)
+      - a diphthong never takes the first half of a long vowel (aii → aī)
+    Returns (compiled pattern, replacement map).
+    """
+    replacements = dict(AFFRICATE_MAP)
+    alternatives = [re.escape(k) for k in sorted(AFFRICATE_MAP, key=len, reverse=True)]
+    # (sequence, replacement, glide that must not follow)
+    vowel_forms = []
+    for digraph, letter in LONG_VOWEL_MAP.items():
+        for glide in 'iu':
+            if letter + glide in DIPHTHONG_MAP:
+                vowel_forms.append((digraph + glide, DIPHTHONG_MAP[letter + glide], glide))
+    vowel_forms += [(digraph, letter, None) for digraph, letter in LONG_VOWEL_MAP.items()]
+    vowel_forms += [(digraph, letter, digraph[-1]) for digraph, letter in DIPHTHONG_MAP.items()]
+    for seq, letter, glide in sorted(vowel_forms, key=lambda x: -len(x[0])):
+        replacements[seq] = letter
+        alternatives.append(re.escape(seq) + (f'(?!{glide})' if glide else ''))
+    return re.compile('|'.join(alternatives)), replacements
+
+
+_NORMALIZE_RE, _NORMALIZE_MAP = _build_normalize_pattern()
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
 def normalize(word: str) -> str:
     """
     Normalize a word by converting digraphs to single letters.
     e.g., 'weilu' → 'wɛlu', 'kai' → 'kæ', 'tra' → 'ŧa', 'neer' → 'nēr'
     """
-    result = word.lower()
-    # Sort by length descending to match longer patterns first (tch before ts, āi before ai)
-    for digraph, letter in sorted(AFFRICATE_MAP.items(), key=lambda x: -len(x[0])):
-        result = result.replace(digraph, letter)
-    # Long vowels (ee → ē) - must come BEFORE diphthongs to avoid conflicts
-    for digraph, letter in sorted(LONG_VOWEL_MAP.items(), key=lambda x: -len(x[0])):
-        result = result.replace(digraph, letter)
-    for digraph, letter in sorted(DIPHTHONG_MAP.items(), key=lambda x: -len(x[0])):
-        result = result.replace(digraph, letter)
-    return result
+    # Already-lowercase input (the common case) skips the lower() copy
+    if not word.islower():
+        word = word.lower()
+    return _NORMALIZE_RE.sub(lambda m: _NORMALIZE_MAP[m.group()], word)
 
 
 def tokenize(word: str) -> list:
     """Break word into Nyrakai phonemes"""
-    tokens = []
-    i = 0
-    word = word.lower()
-    
-    COMBINING_MACRON = '\u0304'  # ̄
-    
-    while i < len(word):
-        # Check for ejectives (2-char: k', p', t')
-        if i + 1 < len(word) and word[i:i+2] in EJECTIVES:
-            tokens.append(word[i:i+2])
-            i += 2
-        # Check for long diphthongs with combining macron (2-char: base + ̄)
-        elif i + 1 < len(word) and word[i+1] == COMBINING_MACRON:
-            tokens.append(word[i:i+2])  # base + macron as single token
-            i += 2
-        # Check for glottal marker (')
-        elif word[i] == GLOTTAL_MARKER:
-            if i + 1 < len(word):
-                next_char = word[i+1]
-                # 'V pattern: glottal + vowel (onset/nucleus modifier)
-                if next_char in ALL_VOWELS:
-                    tokens.append("'" + next_char)  # 'V as single unit
-                    i += 2
-                else:
-                    # V' pattern: the ' follows a vowel, adds schwa-glottal as coda
-                    # Just add ' as a glottal coda marker
-                    tokens.append("'")
-                    i += 1
-            else:
-                # Word-final ' (rare but handle it)
-                tokens.append("'")
-                i += 1
-        # Check for diphthongs
-        elif word[i] in DIPHTHONGS_LONG or word[i] in DIPHTHONGS_SHORT:
-            tokens.append(word[i])
-            i += 1
-        # Check for long vowels
-        elif word[i] in VOWELS_LONG:
-            tokens.append(word[i])
-            i += 1
-        # Single characters
-        else:
-            tokens.append(word[i])
-            i += 1
-    
-    return tokens
+    return list(_tokenize_cached(word))
+
+
+# Phoneme tokens, longest alternatives first (order matters):
+#   ejective (k^, p^, t^) | any letter + combining macron (long diphthong)
+#   | 'V (glottal + vowel, onset/nucleus modifier) | any single character
+# A ' not followed by a vowel falls through to the last branch (glottal coda).
+COMBINING_MACRON = '\u0304'  # ̄
+_TOKEN_RE = re.compile(
+    '|'.join(re.escape(e) for e in sorted(EJECTIVES))
+    + '|.' + COMBINING_MACRON
+    + '|' + re.escape(GLOTTAL_MARKER)
+    + '[' + ''.join(sorted(re.escape(v) for v in ALL_VOWELS if len(v) == 1)) + ']'
+    + '|.',
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def _tokenize_cached(word: str) -> tuple:
+    """Cached core of tokenize() (a tuple of interned phonemes, so callers cannot mutate it)."""
+    if not word.islower():
+        word = word.lower()
+    return tuple(map(sys.intern, _TOKEN_RE.findall(word)))
 
 
 def is_glottal_vowel(phoneme: str) -> bool:
     """Check if phoneme is a glottal-modified vowel ('V)"""
-    return phoneme.startswith("'") and len(phoneme) == 2 and phoneme[1] in ALL_VOWELS
+    return phoneme in GLOTTAL_VOWELS
 
 
 def is_glottal_coda(phoneme: str) -> bool:
@@ -288,18 +420,27 @@ def is_glottal_coda(phoneme: str) -> bool:
 
 def is_vowel(phoneme: str) -> bool:
     """Check if phoneme is a vowel (including glottal-modified vowels and long diphthongs)"""
-    return phoneme in ALL_VOWELS or is_glottal_vowel(phoneme) or phoneme in DIPHTHONGS_LONG_COMBINING
+    return phoneme in NUCLEUS_PHONEMES
 
 
 def is_consonant(phoneme: str) -> bool:
     """Check if phoneme is a consonant (not including glottal coda)"""
-    return phoneme in CONSONANTS or phoneme in GLIDES or phoneme in AFFRICATES or phoneme in EJECTIVES
+    return phoneme in ALL_CONSONANTS
 
 
 def is_coda_valid(phoneme: str) -> bool:
     """Check if phoneme can be in coda position"""
     # Regular consonants and glottal coda (') are valid
-    return is_consonant(phoneme) or is_glottal_coda(phoneme)
+    return phoneme in ALL_CONSONANTS or phoneme == GLOTTAL_MARKER
+
+
+# Phoneme classes for syllabify/validate_syllable (unlisted = unknown token)
+NUCLEUS, CONSONANT, GLOTTAL_CODA, UNKNOWN = range(4)
+PHONEME_CLASS = {
+    **dict.fromkeys(ALL_CONSONANTS, CONSONANT),
+    **dict.fromkeys(NUCLEUS_PHONEMES, NUCLEUS),
+    GLOTTAL_MARKER: GLOTTAL_CODA,
+}
 
 
 def syllabify(tokens: list) -> tuple:
@@ -312,72 +453,70 @@ def syllabify(tokens: list) -> tuple:
     if not tokens:
         return [], ["Empty word"]
     
+    # Classify every token once, then make a single forward pass. Each
+    # syllable is the span tokens[start:i + 1] ending at its nucleus/coda.
+    classes = [PHONEME_CLASS.get(t, UNKNOWN) for t in tokens]
+    n = len(tokens)
     syllables = []
     errors = []
-    current = []
+    start = 0
+    stray_onset = []  # onset consonants split off by a stray token (error case)
     i = 0
     
-    while i < len(tokens):
-        token = tokens[i]
+    while i < n:
+        cls = classes[i]
         
-        if is_vowel(token):
-            # Vowel found - this is the nucleus
-            current.append(token)
-            
-            # Check for glottal coda (') immediately after vowel
-            if i + 1 < len(tokens) and is_glottal_coda(tokens[i + 1]):
-                current.append(tokens[i + 1])  # Add ' as coda
+        if cls == NUCLEUS:
+            # Glottal coda (') immediately after vowel
+            if i + 1 < n and classes[i + 1] == GLOTTAL_CODA:
                 i += 1
             
-            # Check for consonant coda
-            if i + 1 < len(tokens) and is_consonant(tokens[i + 1]):
-                # Look ahead: is there another vowel after?
-                if i + 2 < len(tokens) and is_vowel(tokens[i + 2]):
+            # Consonant coda: it stays here unless it can start the next onset
+            if i + 1 < n and classes[i + 1] == CONSONANT:
+                after = classes[i + 2] if i + 2 < n else None
+                if after == NUCLEUS:
                     # Next consonant goes to next syllable (onset)
                     pass
-                elif i + 2 < len(tokens) and is_consonant(tokens[i + 2]):
-                    # Two consonants ahead - first is coda, second+ is next onset
-                    # Check if they could be a valid cluster
-                    c1, c2 = tokens[i + 1], tokens[i + 2]
-                    if c1 in VALID_CLUSTERS and c2 in VALID_CLUSTERS.get(c1, set()):
-                        # Valid cluster - both go to next syllable
-                        pass
-                    else:
-                        # Not a valid cluster - first is coda
-                        current.append(tokens[i + 1])
+                elif after == CONSONANT:
+                    # Two consonants ahead - a valid cluster goes to the next onset,
+                    # otherwise the first is coda
+                    if tokens[i + 2] not in VALID_CLUSTERS.get(tokens[i + 1], ()):
                         i += 1
                 else:
                     # Last consonant is coda
-                    current.append(tokens[i + 1])
                     i += 1
             
             # Complete syllable
-            syllables.append(current)
-            current = []
-        
-        elif is_consonant(token):
-            # Consonant - add to current (onset)
-            current.append(token)
+            syllables.append([*stray_onset, *tokens[start:i + 1]] if stray_onset else tokens[start:i + 1])
+            stray_onset = []
+            start = i + 1
         
-        elif is_glottal_coda(token):
-            # Orphan glottal (shouldn't happen if tokenizer works right)
-            errors.append(f"Unexpected glottal marker position: {token}")
-        
-        else:
-            errors.append(f"Unknown token: '{token}'")
+        elif cls != CONSONANT:
+            # Stray token: reported and left out of the syllable
+            if cls == GLOTTAL_CODA:
+                # Orphan glottal (shouldn't happen if tokenizer works right)
+                errors.append(f"Unexpected glottal marker position: {tokens[i]}")
+            else:
+                errors.append(f"Unknown token: '{tokens[i]}'")
+            stray_onset += tokens[start:i]
+            start = i + 1
         
         i += 1
     
-    # Handle remaining consonants (shouldn't happen in valid word)
-    if current:
-        if any(is_consonant(t) or is_glottal_coda(t) for t in current) and not any(is_vowel(t) for t in current):
-            errors.append(f"Syllable without vowel: {''.join(current)}")
-        else:
-            syllables.append(current)
+    # Remaining consonants have no vowel (shouldn't happen in valid word)
+    remaining = [*stray_onset, *tokens[start:]]
+    if remaining:
+        errors.append(f"Syllable without vowel: {''.join(remaining)}")
     
     return syllables, errors
 
 
+# Structure strings for every legal (onset, glottal, coda) shape
+STRUCT_TABLE = {
+    (o, g, c): sys.intern("C" * o + "V" + ("'" if g else "") + "C" * c)
+    for o in (0, 1, 2) for g in (False, True) for c in (0, 1)
+}
+
 def validate_syllable(syllable: list) -> tuple:
     """
     Validate a single syllable follows (C)(C)V(')(C) pattern.
@@ -394,17 +533,19 @@ def validate_syllable(syllable: list) -> tuple:
     coda = []
     
     found_vowel = False
+    classify = PHONEME_CLASS.get
     for i, token in enumerate(syllable):
-        if is_vowel(token):
+        if classify(token) == NUCLEUS:
             if found_vowel:
                 errors.append(f"Multiple vowels in syllable: {syllable}")
             nucleus = token
             found_vowel = True
             # Rest is coda (glottal and/or consonant)
             for t in syllable[i+1:]:
-                if is_glottal_coda(t):
+                cls = classify(t)
+                if cls == GLOTTAL_CODA:
                     glottal_coda = True
-                elif is_consonant(t):
+                elif cls == CONSONANT:
                     coda.append(t)
             break
         else:
@@ -415,9 +556,11 @@ def validate_syllable(syllable: list) -> tuple:
         return False, "", errors
     
     # Build structure string
-    # V' counts as V' (vowel + glottal)
-    glottal_str = "'" if glottal_coda else ""
-    structure = "C" * len(onset) + "V" + glottal_str + "C" * len(coda)
+    # V' counts as V' (vowel + glottal); legal shapes come from the table
+    key = (len(onset), glottal_coda, len(coda))
+    structure = STRUCT_TABLE.get(key)
+    if structure is None:
+        structure = "C" * key[0] + "V" + ("'" if glottal_coda else "") + "C" * key[2]
     
     # Validate: (C)(C)V(')(C) means max 2 onset, optional glottal, max 1 consonant coda
     if len(onset) > 2:
@@ -457,12 +600,30 @@ def validate_word(word: str, auto_normalize: bool = True) -> dict:
     
     Supports gender variant notation: "word1 / word2" validates both.
     """
+    # Cached results are shared; hand out fresh lists (all list values hold strings)
+    cached = _validate_word_cached(word, auto_normalize)
+    return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+
+
+def clear_validation_cache():
+    """
+    Drop memoized validate_word results and rebuild the dictionary-existence
+    lookup they use (call after the dictionary changes).
+    """
+    global _NYR_TO_ENG, _ENG_TO_NYR
+    _validate_word_cached.cache_clear()
+    _NYR_TO_ENG, _ENG_TO_NYR = load_dictionary_words()
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def _validate_word_cached(word: str, auto_normalize: bool = True) -> dict:
+    """Uncached body of validate_word(); its result must not be mutated."""
     # Handle gender variant pattern (e.g., "fāri / fārā")
-    if ' / ' in word:
-        variants = [v.strip() for v in word.split(' / ')]
+    variants = _split_variants(word)
+    if len(variants) > 1:
         all_valid = True
         all_errors = []
-        all_warnings = [f"Gender variants: {' / '.join(variants)}"]
+        all_warnings = [f"Gender variants: {VARIANT_SEP.join(variants)}"]
         all_phonemes = []
         
         for variant in variants:
@@ -485,7 +646,8 @@ def validate_word(word: str, auto_normalize: bool = True) -> dict:
         }
     
     # Normalize diphthongs if enabled
-    normalized = normalize(word) if auto_normalize else word.lower()
+    lowered = word.lower()
+    normalized = normalize(word) if auto_normalize else lowered
     
     result = {
         "word": word,
@@ -499,7 +661,7 @@ def validate_word(word: str, auto_normalize: bool = True) -> dict:
     }
     
     # Add warning if word was normalized
-    if normalized != word.lower():
+    if normalized != lowered:
         result["warnings"].append(f"Auto-normalized: '{word}' → '{normalized}'")
     
     tokens = tokenize(normalized)
@@ -518,21 +680,14 @@ def validate_word(word: str, auto_normalize: bool = True) -> dict:
         result["valid"] = False
         return result
     
-    # Check all phonemes are valid
-    all_valid = CONSONANTS | VOWELS | GLIDES | AFFRICATES | DIPHTHONGS | set(EJECTIVES)
-    for t in tokens:
-        # Allow glottal-modified vowels ('V pattern)
-        if is_glottal_vowel(t):
-            continue
-        # Allow glottal coda (')
-        if is_glottal_coda(t):
-            continue
-        # Allow long diphthongs with combining macron
-        if t in DIPHTHONGS_LONG_COMBINING:
-            continue
-        if t not in all_valid:
-            result["errors"].append(f"Invalid phoneme: '{t}'")
-            result["valid"] = False
+    # Check all phonemes are valid (including 'V, the glottal coda and
+    # long diphthongs with combining macron)
+    # One C-level subset test gates the per-token loop (only needed for errors)
+    if not VALID_PHONEMES.issuperset(tokens):
+        for t in tokens:
+            if t not in VALID_PHONEMES:
+                result["errors"].append(f"Invalid phoneme: '{t}'")
+                result["valid"] = False
     
     if not result["valid"]:
         return result
@@ -575,8 +730,13 @@ def validate_word(word: str, auto_normalize: bool = True) -> dict:
     return result
 
 
-def add_word(nyrakai: str, english: str, pos: str, is_root: bool = True, etymology: str = "") -> dict:
-    """Add a word to the dictionary after validation"""
+def add_word(nyrakai: str, english: str, pos: str, is_root: bool = True, etymology: str = "",
+             journal: bool = False) -> dict:
+    """
+    Add a word to the dictionary after validation.
+    With journal=True the entry is appended to JOURNAL_PATH instead of
+    rewriting the whole dictionary (for bulk imports; run compact() after).
+    """
     
     validation = validate_word(nyrakai)
     
@@ -587,24 +747,24 @@ def add_word(nyrakai: str, english: str, pos: str, is_root: bool = True, etymolo
         }
     
     # Load dictionary
-    with open(DICT_PATH, 'r') as f:
-        dictionary = json.load(f)
+    dictionary = _load_dict()
     
     # Check if Nyrakai word already exists
-    for w in dictionary["words"]:
-        if w["nyrakai"] == nyrakai or w["nyrakai"] == validation["normalized"]:
-            return {
-                "success": False,
-                "error": f"Nyrakai word '{nyrakai}' already exists in dictionary"
-            }
+    by_nyrakai = _DICT_CACHE["by_nyrakai"]
+    if nyrakai in by_nyrakai or validation["normalized"] in by_nyrakai:
+        return {
+            "success": False,
+            "error": f"Nyrakai word '{nyrakai}' already exists in dictionary"
+        }
     
-    # Check if English meaning already exists
-    for w in dictionary["words"]:
-        if w["english"].lower() == english.lower():
-            return {
-                "success": False,
-                "error": f"English meaning '{english}' already has a Nyrakai word: '{w['nyrakai']}'"
-            }
+    # Check if English meaning already exists (report the first match)
+    english_hits = _DICT_CACHE["by_english"].get(english.lower())
+    if english_hits:
+        w = dictionary["words"][english_hits[0]]
+        return {
+            "success": False,
+            "error": f"English meaning '{english}' already has a Nyrakai word: '{w['nyrakai']}'"
+        }
     
     # Add word
     entry = {
@@ -621,9 +781,22 @@ def add_word(nyrakai: str, english: str, pos: str, is_root: bool = True, etymolo
     dictionary["words"].append(entry)
     dictionary["meta"]["total_words"] = len(dictionary["words"])
     
-    # Save
-    with open(DICT_PATH, 'w') as f:
-        json.dump(dictionary, f, indent=2, ensure_ascii=False)
+    # Save, then index the new entry in place so the cache stays current
+    # without re-reading the file (a failed write drops the mutated cache)
+    try:
+        if journal:
+            line = orjson.dumps(entry).decode() if ORJSON_AVAILABLE else json.dumps(entry, ensure_ascii=False)
+            with open(JOURNAL_PATH, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        else:
+            _write_dict(dictionary)
+    except BaseException:
+        _invalidate_dict_cache()
+        clear_validation_cache()
+        raise
+    _index_entry(len(dictionary["words"]) - 1, entry)
+    _DICT_CACHE["stamp"] = _dict_stamp()
+    clear_validation_cache()
     
     return {
         "success": True,
@@ -633,47 +806,47 @@ def add_word(nyrakai: str, english: str, pos: str, is_root: bool = True, etymolo
 
 def lookup(word: str) -> dict:
     """Look up a word in the dictionary (by Nyrakai or English)"""
-    with open(DICT_PATH, 'r') as f:
-        dictionary = json.load(f)
+    dictionary = _load_dict()
     
-    for w in dictionary["words"]:
-        if w["nyrakai"] == word or w["english"].lower() == word.lower():
-            return w
+    # First entry in file order matching either form (a copy - the cache is shared)
+    hits = _DICT_CACHE["by_nyrakai"].get(word, []) + _DICT_CACHE["by_english"].get(word.lower(), [])
+    if hits:
+        return dict(dictionary["words"][min(hits)])
     
     return None
 
 
 def check_duplicate(nyrakai: str = None, english: str = None) -> dict:
     """Check if a word or meaning already exists"""
-    with open(DICT_PATH, 'r') as f:
-        dictionary = json.load(f)
+    words = _load_dict()["words"]
     
     result = {"exists": False, "nyrakai_match": None, "english_match": None}
     
-    normalized = normalize(nyrakai) if nyrakai else None
-    
-    for w in dictionary["words"]:
-        if nyrakai and (w["nyrakai"] == nyrakai or w["nyrakai"] == normalized):
+    # Last matching entry in file order wins for each field
+    if nyrakai:
+        by_nyrakai = _DICT_CACHE["by_nyrakai"]
+        hits = by_nyrakai.get(nyrakai, []) + by_nyrakai.get(normalize(nyrakai), [])
+        if hits:
             result["exists"] = True
-            result["nyrakai_match"] = w
-        if english and w["english"].lower() == english.lower():
+            result["nyrakai_match"] = dict(words[max(hits)])
+    if english:
+        hits = _DICT_CACHE["by_english"].get(english.lower())
+        if hits:
             result["exists"] = True
-            result["english_match"] = w
+            result["english_match"] = dict(words[hits[-1]])
     
     return result
 
 
 def list_words() -> list:
     """List all words in dictionary"""
-    with open(DICT_PATH, 'r') as f:
-        dictionary = json.load(f)
-    return dictionary["words"]
+    # Copy each entry so callers can't edit the shared cached dictionary
+    return [dict(w) for w in _load_dict()["words"]]
 
 
 def validate_dictionary() -> dict:
     """Validate ALL words in dictionary against current rules"""
-    with open(DICT_PATH, 'r') as f:
-        dictionary = json.load(f)
+    dictionary = _load_dict()
     
     results = {
         "total": len(dictionary["words"]),
@@ -682,8 +855,12 @@ def validate_dictionary() -> dict:
         "invalid_words": []
     }
     
+    # One serial pass in this process (no onset/domain work - that is
+    # check_category_onset's separate pass over the same cached dictionary).
+    # Read the shared cached results directly; only failures copy their errors.
+    # Pass auto_normalize as validate_word does so both hit the same cache key.
     for w in dictionary["words"]:
-        validation = validate_word(w["nyrakai"])
+        validation = _validate_word_cached(w["nyrakai"], True)
         if validation["valid"]:
             results["valid"] += 1
         else:
@@ -691,28 +868,92 @@ def validate_dictionary() -> dict:
             results["invalid_words"].append({
                 "nyrakai": w["nyrakai"],
                 "english": w["english"],
-                "errors": validation["errors"]
+                "errors": list(validation["errors"])
             })
     
     return results
 
 
-def edit_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein edit distance between two strings."""
+def edit_distance(s1: str, s2: str, cutoff: int = None) -> int:
+    """
+    Calculate Levenshtein edit distance between two strings.
+    With a cutoff, any distance above it is reported as cutoff + 1
+    (the computation stops as soon as that is certain).
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(s1, s2, score_cutoff=cutoff)
     if len(s1) < len(s2):
-        return edit_distance(s2, s1)
-    if len(s2) == 0:
+        s1, s2 = s2, s1
+    m = len(s2)
+    if cutoff is not None and len(s1) - m > cutoff:
+        return cutoff + 1
+    if m == 0:
         return len(s1)
-    prev_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        curr_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = prev_row[j + 1] + 1
-            deletions = curr_row[j] + 1
-            substitutions = prev_row[j] + (c1 != c2)
-            curr_row.append(min(insertions, deletions, substitutions))
-        prev_row = curr_row
-    return prev_row[-1]
+    # Bit-parallel DP (Myers/Hyyro): one DP column of the shorter string is
+    # held as +1/-1 vertical delta bit-vectors in Python ints, so each
+    # character of s1 costs a few big-int operations instead of a row loop
+    peq = {}
+    for i, c in enumerate(s2):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, dist = mask, 0, m
+    remaining = len(s1)
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            dist += 1
+        elif mh & last:
+            dist -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        # Each remaining character can lower the distance by at most one
+        remaining -= 1
+        if cutoff is not None and dist - remaining > cutoff:
+            return cutoff + 1
+    return dist
+
+
+def _similarity_trie() -> dict:
+    """
+    Trie (nested dicts keyed by character) over every dictionary variant
+    longer than 2 letters. The None key holds (position, variant index,
+    variant, meaning) for each entry spelled by the path to that node.
+    """
+    dictionary = _load_dict()
+    if _DICT_CACHE["trie"] is None:
+        trie = {}
+        for position, w in enumerate(dictionary["words"]):
+            existing = w["nyrakai"]
+            # Handle gender variants
+            for k, variant in enumerate(_split_variants(existing)):
+                if len(variant) > 2:
+                    node = trie
+                    for ch in variant:
+                        node = node.setdefault(ch, {})
+                    node.setdefault(None, []).append((position, k, variant, w["english"]))
+        _DICT_CACHE["trie"] = trie
+    return _DICT_CACHE["trie"]
+
+
+def _search_trie(node: dict, ch: str, word: str, prev_row: list, threshold: int, found: list):
+    """Extend the Levenshtein DP by one trie character, pruning dead branches."""
+    row = [prev_row[0] + 1]
+    for j, c in enumerate(word):
+        row.append(min(row[j] + 1, prev_row[j + 1] + 1, prev_row[j] + (c != ch)))
+    if None in node and row[-1] <= threshold:
+        found.extend((entry, row[-1]) for entry in node[None])
+    # Row minimums never decrease further down the trie
+    if min(row) <= threshold:
+        for next_ch, child in node.items():
+            if next_ch is not None:
+                _search_trie(child, next_ch, word, row, threshold, found)
 
 
 def check_similarity(word: str, threshold: int = 2) -> dict:
@@ -720,30 +961,25 @@ def check_similarity(word: str, threshold: int = 2) -> dict:
     Check if a word is too similar to existing dictionary words.
     Returns dict with similar words found (edit distance <= threshold).
     """
-    with open(DICT_PATH, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
-    
     normalized = normalize(word)
     similar = []
     
-    for w in dictionary["words"]:
-        existing = w["nyrakai"]
-        # Handle gender variants
-        if ' / ' in existing:
-            variants = [v.strip() for v in existing.split(' / ')]
-        else:
-            variants = [existing]
-        
-        for variant in variants:
+    if len(normalized) > 2:
+        found = []
+        first_row = list(range(len(normalized) + 1))
+        for ch, child in _similarity_trie().items():
+            if ch is not None:
+                _search_trie(child, ch, normalized, first_row, threshold, found)
+        # Back to dictionary order (entry, then variant) before sorting by distance
+        found.sort(key=lambda hit: hit[0][:2])
+        for (_, _, variant, meaning), dist in found:
             if variant == normalized:
                 continue  # Skip exact match
-            dist = edit_distance(normalized, variant)
-            if dist <= threshold and len(normalized) > 2 and len(variant) > 2:
-                similar.append({
-                    "word": variant,
-                    "meaning": w["english"],
-                    "distance": dist
-                })
+            similar.append({
+                "word": variant,
+                "meaning": meaning,
+                "distance": dist
+            })
     
     # Sort by distance
     similar.sort(key=lambda x: x["distance"])
@@ -758,33 +994,62 @@ def check_similarity(word: str, threshold: int = 2) -> dict:
 
 
 def check_all_similarities(threshold: int = 1) -> list:
-    """Find all confusingly similar pairs in dictionary."""
-    with open(DICT_PATH, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
+    """
+    Find all confusingly similar pairs in dictionary.
+    Gender variants of the same entry (fāri / fārā) are never paired.
+    """
+    dictionary = _load_dict()
     
-    # Build list of all words
+    # Build list of all words (only words longer than 2 letters are compared),
+    # tagged with their entry position
     all_words = []
-    for w in dictionary["words"]:
+    for position, w in enumerate(dictionary["words"]):
         nyr = w["nyrakai"]
         eng = w["english"]
-        if ' / ' in nyr:
-            for v in nyr.split(' / '):
-                all_words.append((v.strip(), eng))
-        else:
-            all_words.append((nyr, eng))
+        all_words.extend((v, eng, position) for v in _split_variants(nyr) if len(v) > 2)
     
     # Find similar pairs
     pairs = []
-    for i, (w1, e1) in enumerate(all_words):
-        for (w2, e2) in all_words[i+1:]:
-            if len(w1) > 2 and len(w2) > 2:
-                dist = edit_distance(w1, w2)
-                if dist <= threshold:
-                    pairs.append({
-                        "word1": w1, "meaning1": e1,
-                        "word2": w2, "meaning2": e2,
-                        "distance": dist
-                    })
+    if CDIST_AVAILABLE and 0 <= threshold < 255:
+        words = [nyr for nyr, _, _ in all_words]
+        matrix = cdist(words, words, scorer=Levenshtein.distance,
+                       score_cutoff=threshold, dtype=np.uint8, workers=-1)
+        # Upper triangle in row-major order matches the nested loop below
+        for i, j in zip(*np.nonzero(np.triu(matrix <= threshold, k=1))):
+            (w1, e1, p1), (w2, e2, p2) = all_words[i], all_words[j]
+            if p1 == p2:
+                continue
+            pairs.append({
+                "word1": w1, "meaning1": e1,
+                "word2": w2, "meaning2": e2,
+                "distance": int(matrix[i, j])
+            })
+        return pairs
+    
+    # Words whose lengths differ by more than threshold can't be that close,
+    # so only pair each length bucket with itself and the next few lengths
+    by_len = {}
+    for i, (nyr, _, _) in enumerate(all_words):
+        by_len.setdefault(len(nyr), []).append(i)
+    candidates = []
+    for length, indexes in by_len.items():
+        candidates.extend((i, j) for n, i in enumerate(indexes) for j in indexes[n + 1:])
+        for other in range(length + 1, length + threshold + 1):
+            for j in by_len.get(other, ()):
+                candidates.extend((min(i, j), max(i, j)) for i in indexes)
+    candidates.sort()  # original pair order
+    
+    for i, j in candidates:
+        (w1, e1, p1), (w2, e2, p2) = all_words[i], all_words[j]
+        if p1 == p2:
+            continue
+        dist = edit_distance(w1, w2, threshold)
+        if dist <= threshold:
+            pairs.append({
+                "word1": w1, "meaning1": e1,
+                "word2": w2, "meaning2": e2,
+                "distance": dist
+            })
     
     return pairs
 
@@ -804,8 +1069,7 @@ def check_category_onset(include_all: bool = False) -> dict:
     if not SOUND_MAP_AVAILABLE:
         return {"error": "Sound map not available"}
     
-    with open(DICT_PATH, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
+    dictionary = _load_dict()
     
     mismatches = []
     unmapped_onsets = []
@@ -813,7 +1077,7 @@ def check_category_onset(include_all: bool = False) -> dict:
     no_category_map = set()
     
     for entry in dictionary.get("words", []):
-        nyr = entry.get("nyrakai", "").split(" / ")[0]
+        nyr = _split_variants(entry.get("nyrakai", ""))[0]
         eng = entry.get("english", "")
         category = entry.get("category", "")
         is_root = entry.get("is_root", True)
@@ -871,10 +1135,34 @@ def check_category_onset(include_all: bool = False) -> dict:
 # AFFIX COLLISION CHECKING
 # ============================================================
 
-def check_affix_overlap(word: str) -> dict:
+def _affix_index(affixes: dict) -> tuple:
+    """(distinct affix lengths, affix -> (registry position, meaning))."""
+    lengths = tuple(sorted({len(a) for a in affixes}))
+    return lengths, {a: (i, meaning) for i, (a, meaning) in enumerate(affixes.items())}
+
+
+PREFIX_INDEX = _affix_index(AFFIXES['prefixes'])
+SUFFIX_INDEX = _affix_index(AFFIXES['suffixes'])
+
+
+def _affix_hits(word: str, index: tuple, suffix: bool, min_remaining: int = 0) -> list:
+    """
+    Affixes that start (or end) word and leave at least min_remaining letters,
+    in registry order. One slice + dict lookup per distinct affix length.
+    """
+    lengths, positions = index
+    limit = len(word) - min_remaining
+    hits = [a for a in (word[-n:] if suffix else word[:n] for n in lengths if n <= limit)
+            if a in positions]
+    hits.sort(key=lambda a: positions[a][0])
+    return hits
+
+
+def check_affix_overlap(word: str, normalized: str = None) -> dict:
     """
     Check if a word accidentally contains affix patterns.
     Type 1 check: New translations shouldn't collide with affixes.
+    Callers that already normalized the word can pass it as normalized.
     
     Returns dict with:
       - word: original word
@@ -883,7 +1171,8 @@ def check_affix_overlap(word: str) -> dict:
       - prefix_matches: list of (prefix, meaning, remaining)
       - suffix_matches: list of (suffix, meaning, remaining)
     """
-    normalized = normalize(word)
+    if normalized is None:
+        normalized = normalize(word)
     result = {
         "word": word,
         "normalized": normalized,
@@ -894,31 +1183,23 @@ def check_affix_overlap(word: str) -> dict:
         "warnings": []
     }
     
-    # Check prefixes
-    for prefix, meaning in AFFIXES['prefixes'].items():
-        if normalized.startswith(prefix):
-            remaining = normalized[len(prefix):]
-            # Only flag if remaining part could be a valid root
-            if len(remaining) >= MIN_ROOT_FOR_AFFIX:
-                result["prefix_matches"].append({
-                    "affix": prefix,
-                    "meaning": meaning,
-                    "remaining": remaining
-                })
-                result["has_prefix_overlap"] = True
-    
-    # Check suffixes
-    for suffix, meaning in AFFIXES['suffixes'].items():
-        if normalized.endswith(suffix):
-            remaining = normalized[:-len(suffix)]
-            # Only flag if remaining part could be a valid root
-            if len(remaining) >= MIN_ROOT_FOR_AFFIX:
-                result["suffix_matches"].append({
-                    "affix": suffix,
-                    "meaning": meaning,
-                    "remaining": remaining
-                })
-                result["has_suffix_overlap"] = True
+    # Check prefixes (only flag if remaining part could be a valid root)
+    for prefix in _affix_hits(normalized, PREFIX_INDEX, False, MIN_ROOT_FOR_AFFIX):
+        result["prefix_matches"].append({
+            "affix": prefix,
+            "meaning": PREFIX_INDEX[1][prefix][1],
+            "remaining": normalized[len(prefix):]
+        })
+        result["has_prefix_overlap"] = True
+    
+    # Check suffixes (only flag if remaining part could be a valid root)
+    for suffix in _affix_hits(normalized, SUFFIX_INDEX, True, MIN_ROOT_FOR_AFFIX):
+        result["suffix_matches"].append({
+            "affix": suffix,
+            "meaning": SUFFIX_INDEX[1][suffix][1],
+            "remaining": normalized[:-len(suffix)]
+        })
+        result["has_suffix_overlap"] = True
     
     # Generate warnings
     if result["has_prefix_overlap"]:
@@ -938,6 +1219,52 @@ def check_affix_overlap(word: str) -> dict:
     return result
 
 
+def _collision_index() -> tuple:
+    """
+    (existing_words, roots, roots_by_nyrakai) for the derivation checks,
+    built once per dictionary version. Shared between calls - treat as
+    read-only. existing_words maps each form to a flat
+    (meaning, derived_root, derived_affix, is_variant) tuple, roots is a
+    list of (nyrakai, english) and roots_by_nyrakai maps a root form to its
+    (position, meaning) entries for check_word_for_collisions.
+    """
+    dictionary = _load_dict()
+    if _DICT_CACHE["collision"] is None:
+        # Build lookup of all existing words with their metadata
+        existing_words = {}  # word -> (meaning, derived_root, derived_affix, is_variant)
+        roots = []
+        roots_by_nyrakai = {}
+        
+        for position, entry in enumerate(dictionary.get("words", [])):
+            nyr = entry.get("nyrakai", "")
+            eng = entry.get("english", "")
+            is_root = entry.get("is_root", False)
+            # derived_from is {"root", "affix"}, or just the root's spelling
+            derived_from = entry.get("derived_from", None) or {}
+            if isinstance(derived_from, str):
+                derived_from = {"root": derived_from}
+            derived_root = derived_from.get("root")
+            derived_affix = derived_from.get("affix")
+            
+            # Handle variant notation (e.g., "fāri / fārā" for gendered plurals)
+            variants = _split_variants(nyr)
+            if len(variants) > 1:
+                for v in variants:
+                    # For variants, store derived_from with the root (allows matching any affix from same root)
+                    existing_words[v] = (eng, derived_root, derived_affix, True)
+            else:
+                existing_words[nyr] = (eng, derived_root, derived_affix, False)
+            
+            # Collect roots for derivation
+            if is_root and VARIANT_SEP not in nyr:
+                roots_by_nyrakai.setdefault(nyr, []).append((position, eng))
+                if nyr:
+                    roots.append((nyr, eng))
+        
+        _DICT_CACHE["collision"] = (existing_words, roots, roots_by_nyrakai)
+    return _DICT_CACHE["collision"]
+
+
 def check_derived_collisions(verbose: bool = False, include_intentional: bool = False) -> dict:
     """
     Check if any root+affix combinations create words that already exist.
@@ -953,51 +1280,21 @@ def check_derived_collisions(verbose: bool = False, include_intentional: bool =
       - collisions: list of collision details (accidental only by default)
       - intentional: list of intentional derivations (for reference)
     """
-    with open(DICT_PATH, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
-    
-    # Build lookup of all existing words with their metadata
-    existing_words = {}  # word -> {"meaning": str, "derived_from": dict or None}
-    roots = []
-    
-    for entry in dictionary.get("words", []):
-        nyr = entry.get("nyrakai", "")
-        eng = entry.get("english", "")
-        is_root = entry.get("is_root", False)
-        derived_from = entry.get("derived_from", None)
-        
-        # Handle variant notation (e.g., "fāri / fārā" for gendered plurals)
-        if ' / ' in nyr:
-            variants = [v.strip() for v in nyr.split(' / ')]
-            for v in variants:
-                # For variants, store derived_from with the root (allows matching any affix from same root)
-                existing_words[v] = {
-                    "meaning": eng, 
-                    "derived_from": derived_from,
-                    "is_variant": True,
-                    "all_variants": variants
-                }
-        else:
-            existing_words[nyr] = {"meaning": eng, "derived_from": derived_from, "is_variant": False}
-        
-        # Collect roots for derivation
-        if is_root and nyr and ' / ' not in nyr:
-            roots.append({"nyrakai": nyr, "english": eng})
+    existing_words, roots, _ = _collision_index()
+    existing_get = existing_words.get
     
     collisions = []
     intentional = []
     total_derivations = 0
     
-    for root in roots:
-        nyr = root["nyrakai"]
-        eng = root["english"]
-        
+    for nyr, eng in roots:
         # Generate prefixed forms
         for prefix, prefix_meaning in AFFIXES['prefixes'].items():
             derived = prefix + nyr
             total_derivations += 1
             
-            if derived in existing_words and existing_words[derived]["meaning"] != eng:
+            existing = existing_get(derived)
+            if existing is not None and existing[0] != eng:
                 collision_data = {
                     "type": "prefix",
                     "root": nyr,
@@ -1005,16 +1302,15 @@ def check_derived_collisions(verbose: bool = False, include_intentional: bool =
                     "affix": prefix,
                     "affix_meaning": prefix_meaning,
                     "derived": derived,
-                    "collides_with": existing_words[derived]["meaning"]
+                    "collides_with": existing[0]
                 }
                 
                 # Check if this is an intentional derivation
-                df = existing_words[derived].get("derived_from")
-                is_variant = existing_words[derived].get("is_variant", False)
+                _, derived_root, derived_affix, is_variant = existing
                 
                 # For variants (e.g., fāri/fārā), check if root matches (either affix is valid)
-                if df and df.get("root") == nyr:
-                    if df.get("affix") == prefix or is_variant:
+                if derived_root == nyr:
+                    if derived_affix == prefix or is_variant:
                         collision_data["intentional"] = True
                         intentional.append(collision_data)
                     else:
@@ -1027,7 +1323,8 @@ def check_derived_collisions(verbose: bool = False, include_intentional: bool =
             derived = nyr + suffix
             total_derivations += 1
             
-            if derived in existing_words and existing_words[derived]["meaning"] != eng:
+            existing = existing_get(derived)
+            if existing is not None and existing[0] != eng:
                 collision_data = {
                     "type": "suffix",
                     "root": nyr,
@@ -1035,16 +1332,15 @@ def check_derived_collisions(verbose: bool = False, include_intentional: bool =
                     "affix": suffix,
                     "affix_meaning": suffix_meaning,
                     "derived": derived,
-                    "collides_with": existing_words[derived]["meaning"]
+                    "collides_with": existing[0]
                 }
                 
                 # Check if this is an intentional derivation
-                df = existing_words[derived].get("derived_from")
-                is_variant = existing_words[derived].get("is_variant", False)
+                _, derived_root, derived_affix, is_variant = existing
                 
                 # For variants (e.g., fāri/fārā), check if root matches (either affix is valid)
-                if df and df.get("root") == nyr:
-                    if df.get("affix") == suffix or is_variant:
+                if derived_root == nyr:
+                    if derived_affix == suffix or is_variant:
                         collision_data["intentional"] = True
                         intentional.append(collision_data)
                     else:
@@ -1082,42 +1378,41 @@ def check_word_for_collisions(word: str, english: str = None, category: str = No
     normalized = normalize(word)
     
     # Type 1: Check if word overlaps with affixes
-    affix_check = check_affix_overlap(word)
-    
-    # Type 2: Check if word matches any existing root's derivation
-    with open(DICT_PATH, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
-    
-    derivation_matches = []
-    
-    for entry in dictionary.get("words", []):
-        nyr = entry.get("nyrakai", "")
-        eng = entry.get("english", "")
-        is_root = entry.get("is_root", False)
-        
-        if not is_root or ' / ' in nyr:
-            continue
-        
-        # Check if our new word could be a derivation of an existing root
-        for prefix, meaning in AFFIXES['prefixes'].items():
-            if normalized == prefix + nyr:
-                derivation_matches.append({
-                    "type": "matches_prefix_derivation",
-                    "existing_root": nyr,
-                    "existing_meaning": eng,
-                    "prefix": prefix,
-                    "prefix_meaning": meaning
-                })
-        
-        for suffix, meaning in AFFIXES['suffixes'].items():
-            if normalized == nyr + suffix:
-                derivation_matches.append({
-                    "type": "matches_suffix_derivation",
-                    "existing_root": nyr,
-                    "existing_meaning": eng,
-                    "suffix": suffix,
-                    "suffix_meaning": meaning
-                })
+    affix_check = check_affix_overlap(word, normalized)
+    
+    # Type 2: Check if word matches any existing root's derivation, by
+    # stripping each matching affix and looking the remainder up as a root
+    roots_by_nyrakai = _collision_index()[2]
+    
+    # (entry position, prefix before suffix, registry order, match)
+    found = []
+    for prefix in _affix_hits(normalized, PREFIX_INDEX, False):
+        nyr = normalized[len(prefix):]
+        order, meaning = PREFIX_INDEX[1][prefix]
+        for position, eng in roots_by_nyrakai.get(nyr, ()):
+            found.append((position, 0, order, {
+                "type": "matches_prefix_derivation",
+                "existing_root": nyr,
+                "existing_meaning": eng,
+                "prefix": prefix,
+                "prefix_meaning": meaning
+            }))
+    
+    for suffix in _affix_hits(normalized, SUFFIX_INDEX, True):
+        nyr = normalized[:-len(suffix)]
+        order, meaning = SUFFIX_INDEX[1][suffix]
+        for position, eng in roots_by_nyrakai.get(nyr, ()):
+            found.append((position, 1, order, {
+                "type": "matches_suffix_derivation",
+                "existing_root": nyr,
+                "existing_meaning": eng,
+                "suffix": suffix,
+                "suffix_meaning": meaning
+            }))
+    
+    # Report in dictionary order, as a scan over the entries would
+    found.sort(key=lambda hit: hit[:3])
+    derivation_matches = [hit[3] for hit in found]
     
     # Check existing word collision
     exists, existing_meaning = word_exists_in_dictionary(normalized)
@@ -1168,9 +1463,117 @@ def check_word_for_collisions(word: str, english: str = None, category: str = No
     }
 
 
-if __name__ == "__main__":
-    import sys
+# =============================================================================
+# ENGLISH SIMILARITY CHECK - Avoid words that look/sound too English
+# =============================================================================
+
+# Nyrakai letters → rough English spelling for comparison (applied in order)
+ENGLISH_COMPARE_REPLACEMENTS = (
+    ("^", ""), ("'", ""), ("ē", "e"), ("ā", "a"), ("ī", "i"),
+    ("ō", "o"), ("ū", "u"), ("æ", "ae"), ("œ", "oe"), ("ɛ", "e"),
+    ("ɒ", "o"), ("ə", "e"), ("ț", "t"), ("ƨ", "ts"), ("ƶ", "z"),
+    ("š", "sh"), ("ñ", "n"), ("ŧ", "th"),
+)
+# Every source is a single character and no output contains a later source,
+# so the sequential replaces collapse into one translate table
+ENGLISH_COMPARE_TABLE = str.maketrans(dict(ENGLISH_COMPARE_REPLACEMENTS))
+
+def check_english_similarity(nyrakai_word: str, english_meaning: str, threshold: float = 0.5) -> tuple[bool, list[str]]:
+    """
+    Check if a Nyrakai word is too similar to its English translation.
     
+    Args:
+        nyrakai_word: The Nyrakai word to check
+        english_meaning: The English translation(s), comma-separated if multiple
+        threshold: Similarity threshold (0.0-1.0), default 0.5
+        
+    Returns:
+        tuple: (is_valid, list of warnings)
+    """
+    # Cached results are shared; hand out a fresh warnings list
+    is_valid, warnings = _english_similarity_cached(nyrakai_word, english_meaning, threshold)
+    return is_valid, list(warnings)
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def _english_similarity_cached(nyrakai_word: str, english_meaning: str, threshold: float) -> tuple:
+    """Uncached body of check_english_similarity(); warnings come back as a tuple."""
+    warnings = []
+    
+    # Normalize Nyrakai word (remove diacritics for comparison)
+    nyr_clean = nyrakai_word.lower().translate(ENGLISH_COMPARE_TABLE)
+    
+    # Check against each English meaning
+    for eng in english_meaning.split(','):
+        eng_clean = eng.lower().strip()
+        
+        if not eng_clean or len(eng_clean) < 2:
+            continue
+            
+        # Calculate similarity. real_quick_ratio/quick_ratio (and the LCS
+        # ratio from rapidfuzz's Indel distance) are upper bounds on ratio(),
+        # so most pairs are rejected before matching blocks are computed
+        matcher = SequenceMatcher(None, nyr_clean, eng_clean)
+        sim = 0.0
+        if matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold:
+            total = len(nyr_clean) + len(eng_clean)
+            if not RAPIDFUZZ_AVAILABLE or 2.0 * ((total - Indel.distance(nyr_clean, eng_clean)) // 2) / total >= threshold:
+                sim = matcher.ratio()
+        
+        # Check for substring matches
+        is_substring = (len(nyr_clean) > 2 and len(eng_clean) > 2 and 
+                       (nyr_clean in eng_clean or eng_clean in nyr_clean))
+        
+        # Check same start (3+ chars)
+        same_start = (len(nyr_clean) >= 3 and len(eng_clean) >= 3 and 
+                     nyr_clean[:3] == eng_clean[:3])
+        
+        # Check same end (3+ chars)  
+        same_end = (len(nyr_clean) >= 3 and len(eng_clean) >= 3 and 
+                   nyr_clean[-3:] == eng_clean[-3:])
+        
+        if sim >= threshold:
+            warnings.append(f"Too similar to English '{eng}' ({sim*100:.0f}% match)")
+        if is_substring:
+            warnings.append(f"Contains/contained in English '{eng}'")
+        if same_start and same_end:
+            warnings.append(f"Same start AND end as English '{eng}'")
+    
+    is_valid = len(warnings) == 0
+    return is_valid, tuple(warnings)
+
+
+def validate_word_complete(nyrakai_word: str, english_meaning: str = None, 
+                           check_english: bool = True, english_threshold: float = 0.5) -> dict:
+    """
+    Complete validation including English similarity check.
+    
+    Args:
+        nyrakai_word: The Nyrakai word to validate
+        english_meaning: Optional English meaning for similarity check
+        check_english: Whether to check English similarity
+        english_threshold: Similarity threshold for English check
+        
+    Returns:
+        dict with 'valid', 'errors', 'warnings', 'english_warnings'
+    """
+    # Run standard validation
+    result = validate_word(nyrakai_word)
+    
+    # Add English check if meaning provided
+    result['english_warnings'] = []
+    if check_english and english_meaning:
+        eng_valid, eng_warnings = check_english_similarity(
+            nyrakai_word, english_meaning, english_threshold
+        )
+        result['english_warnings'] = eng_warnings
+        if not eng_valid:
+            result['warnings'] = result.get('warnings', []) + eng_warnings
+    
+    return result
+
+
+if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "--check-dict":
             print("Validating dictionary...")
@@ -1181,10 +1584,15 @@ if __name__ == "__main__":
             print(f"Invalid: {results['invalid']} ✗")
             if results["invalid_words"]:
                 print("\nInvalid words:")
+                # Long reports go out as one write instead of a print per line
+                lines = []
                 for w in results["invalid_words"]:
-                    print(f"  • {w['nyrakai']} ({w['english']})")
-                    for e in w["errors"]:
-                        print(f"    - {e}")
+                    lines.append(f"  • {w['nyrakai']} ({w['english']})")
+                    lines.extend(f"    - {e}" for e in w["errors"])
+                print("\n".join(lines))
+        elif sys.argv[1] == "--compact":
+            folded = compact()
+            print(f"Folded {folded} journaled word(s) into {DICT_PATH.name}")
         elif sys.argv[1] == "--check-similar":
             # Check for confusingly similar words
             threshold = int(sys.argv[2]) if len(sys.argv) > 2 else 1
@@ -1193,8 +1601,10 @@ if __name__ == "__main__":
             pairs = check_all_similarities(threshold)
             if pairs:
                 print(f"Found {len(pairs)} similar pairs:\n")
-                for p in pairs:
-                    print(f"  ⚠️  {p['word1']} ({p['meaning1']}) ↔ {p['word2']} ({p['meaning2']}) [dist={p['distance']}]")
+                print("\n".join(
+                    f"  ⚠️  {p['word1']} ({p['meaning1']}) ↔ {p['word2']} ({p['meaning2']}) [dist={p['distance']}]"
+                    for p in pairs
+                ))
             else:
                 print("✅ No confusingly similar words found!")
         elif sys.argv[1] == "--similarity":
@@ -1263,23 +1673,25 @@ if __name__ == "__main__":
             
             if result["collisions"]:
                 print("\n🔴 ACCIDENTAL COLLISIONS (need review):")
+                lines = []
                 for c in result["collisions"]:
                     if c["type"] == "prefix":
-                        print(f"\n   {c['affix']}- + {c['root']} ({c['root_meaning']})")
-                        print(f"   = {c['derived']} → collides with '{c['collides_with']}'")
+                        lines.append(f"\n   {c['affix']}- + {c['root']} ({c['root_meaning']})")
                     else:
-                        print(f"\n   {c['root']} ({c['root_meaning']}) + -{c['affix']}")
-                        print(f"   = {c['derived']} → collides with '{c['collides_with']}'")
+                        lines.append(f"\n   {c['root']} ({c['root_meaning']}) + -{c['affix']}")
+                    lines.append(f"   = {c['derived']} → collides with '{c['collides_with']}'")
+                print("\n".join(lines))
             else:
                 print("\n✅ No accidental collisions found!")
             
             if show_all and result["intentional"]:
                 print("\n🟢 INTENTIONAL DERIVATIONS (marked in dictionary):")
-                for c in result["intentional"]:
-                    if c["type"] == "prefix":
-                        print(f"   ✓ {c['affix']}- + {c['root']} = {c['derived']} ({c['collides_with']})")
-                    else:
-                        print(f"   ✓ {c['root']} + -{c['affix']} = {c['derived']} ({c['collides_with']})")
+                print("\n".join(
+                    f"   ✓ {c['affix']}- + {c['root']} = {c['derived']} ({c['collides_with']})"
+                    if c["type"] == "prefix" else
+                    f"   ✓ {c['root']} + -{c['affix']} = {c['derived']} ({c['collides_with']})"
+                    for c in result["intentional"]
+                ))
             elif result["intentional_count"] > 0:
                 print(f"\n(Use --check-collisions --all to see {result['intentional_count']} intentional derivations)")
         elif sys.argv[1] == "--check-word":
@@ -1423,6 +1835,7 @@ if __name__ == "__main__":
         print("  python validator.py --check-similar  - Find similar word pairs")
         print("  python validator.py --similarity <w> - Check similarity for word")
         print("  python validator.py --domains        - List sound map domains")
+        print("  python validator.py --compact        - Fold journaled adds into the dictionary")
         print()
         print("Collision Checking:")
         print("  python validator.py --check-affixes <word>   - Check affix overlap (Type 1)")
@@ -1441,94 +1854,3 @@ if __name__ == "__main__":
             if result["errors"]:
                 for e in result["errors"]:
                     print(f"      Error: {e}")
-
-# =============================================================================
-# ENGLISH SIMILARITY CHECK - Avoid words that look/sound too English
-# =============================================================================
-
-from difflib import SequenceMatcher
-
-def check_english_similarity(nyrakai_word: str, english_meaning: str, threshold: float = 0.5) -> tuple[bool, list[str]]:
-    """
-    Check if a Nyrakai word is too similar to its English translation.
-    
-    Args:
-        nyrakai_word: The Nyrakai word to check
-        english_meaning: The English translation(s), comma-separated if multiple
-        threshold: Similarity threshold (0.0-1.0), default 0.5
-        
-    Returns:
-        tuple: (is_valid, list of warnings)
-    """
-    warnings = []
-    
-    # Normalize Nyrakai word (remove diacritics for comparison)
-    nyr_clean = nyrakai_word.lower()
-    for old, new in [("^", ""), ("'", ""), ("ē", "e"), ("ā", "a"), ("ī", "i"), 
-                      ("ō", "o"), ("ū", "u"), ("æ", "ae"), ("œ", "oe"), ("ɛ", "e"),
-                      ("ɒ", "o"), ("ə", "e"), ("ț", "t"), ("ƨ", "ts"), ("ƶ", "z"),
-                      ("š", "sh"), ("ñ", "n"), ("ŧ", "th")]:
-        nyr_clean = nyr_clean.replace(old, new)
-    
-    # Check against each English meaning
-    for eng in english_meaning.split(','):
-        eng_clean = eng.lower().strip()
-        
-        if not eng_clean or len(eng_clean) < 2:
-            continue
-            
-        # Calculate similarity
-        sim = SequenceMatcher(None, nyr_clean, eng_clean).ratio()
-        
-        # Check for substring matches
-        is_substring = (len(nyr_clean) > 2 and len(eng_clean) > 2 and 
-                       (nyr_clean in eng_clean or eng_clean in nyr_clean))
-        
-        # Check same start (3+ chars)
-        same_start = (len(nyr_clean) >= 3 and len(eng_clean) >= 3 and 
-                     nyr_clean[:3] == eng_clean[:3])
-        
-        # Check same end (3+ chars)  
-        same_end = (len(nyr_clean) >= 3 and len(eng_clean) >= 3 and 
-                   nyr_clean[-3:] == eng_clean[-3:])
-        
-        if sim >= threshold:
-            warnings.append(f"Too similar to English '{eng}' ({sim*100:.0f}% match)")
-        if is_substring:
-            warnings.append(f"Contains/contained in English '{eng}'")
-        if same_start and same_end:
-            warnings.append(f"Same start AND end as English '{eng}'")
-    
-    is_valid = len(warnings) == 0
-    return is_valid, warnings
-
-
-def validate_word_complete(nyrakai_word: str, english_meaning: str = None, 
-                           check_english: bool = True, english_threshold: float = 0.5) -> dict:
-    """
-    Complete validation including English similarity check.
-    
-    Args:
-        nyrakai_word: The Nyrakai word to validate
-        english_meaning: Optional English meaning for similarity check
-        check_english: Whether to check English similarity
-        english_threshold: Similarity threshold for English check
-        
-    Returns:
-        dict with 'valid', 'errors', 'warnings', 'english_warnings'
-    """
-    # Run standard validation
-    result = validate_word(nyrakai_word)
-    
-    # Add English check if meaning provided
-    result['english_warnings'] = []
-    if check_english and english_meaning:
-        eng_valid, eng_warnings = check_english_similarity(
-            nyrakai_word, english_meaning, english_threshold
-        )
-        result['english_warnings'] = eng_warnings
-        if not eng_valid:
-            result['warnings'] = result.get('warnings', []) + eng_warnings
-    
-    return result
-
@@ -45,7 +45,7 @@ except ImportError:
     ALL_LISTS = {}
 
 # Swadesh 100 list (Leipzig-Jakarta based)
-SWADESH_100 = [
+SWADESH_100 = (
     "I", "you", "we", "this", "that", "who", "what", "not", "all", "many",
     "one", "two", "big", "long", "small", "woman", "man", "person", "fish", "bird",
     "dog", "louse", "tree", "seed", "leaf", "root", "bark", "skin", "flesh", "blood",
@@ -56,10 +56,10 @@ SWADESH_100 = [
     "say", "sun", "moon", "star", "water", "rain", "stone", "sand", "earth", "cloud",
     "smoke", "fire", "ash", "burn", "path", "mountain", "red", "green", "yellow", "white",
     "black", "night", "hot", "cold", "full", "new", "good", "round", "dry", "name"
-]
+)
 
 # Swadesh 207 list (extended)
-SWADESH_207 = SWADESH_100 + [
+SWADESH_207 = SWADESH_100 + (
     "he", "she", "it", "they", "other", "some", "few", "here", "there", "near",
     "far", "right", "left", "at", "in", "with", "and", "if", "because", "no",
     "yes", "three", "four", "five", "six", "seven", "eight", "nine", "ten", "hundred",
@@ -72,19 +72,19 @@ SWADESH_207 = SWADESH_100 + [
     "laugh", "vomit", "when", "where", "how", "year", "day", "wind", "fog", "sky",
     "sea", "river", "lake", "salt", "dust", "ice", "snow", "rope", "husband", "wife",
     "mother", "father", "animal", "flower", "grass", "meat"
-]
+)
 
 # 912+ word target list organized by category
 TARGET_CATEGORIES = {
-    "The Physical World": [
+    "The Physical World": (
         "air", "area/region", "ash", "cave", "cloud", "earth", "fire", "flame", "fog", 
         "forest/woods", "darkness", "dust", "earth (land)", "gulf/bay", "ice", "island", 
         "lake", "light", "light/kindle/ignite", "lightning", "mainland", "match", "mist", 
         "moon", "mountain", "mud", "plain/field", "rain", "river", "sand", "sea", 
         "shade/shadow", "shore", "sky", "smoke", "snow", "spring/well", "star", "stone", 
         "sun", "thunder", "valley", "water", "wave", "weather", "wind", "world", "wood"
-    ],
-    "Kinship": [
+    ),
+    "Kinship": (
         "ancestors", "aunt", "boy", "brother", "child", "cousin", "daughter", 
         "daughter-in-law", "descendants", "family", "father", "father-in-law", 
         "female (human)", "girl", "granddaughter", "grandfather", "grandmother", 
@@ -92,15 +92,15 @@ TARGET_CATEGORIES = {
         "mother-in-law", "nephew", "niece", "offspring", "orphan", "parents", "person",
         "relatives", "sister", "son-in-law", "stepdaughter", "stepfather", "stepmother", 
         "stepson", "uncle", "widow", "woman"
-    ],
-    "Animals": [
+    ),
+    "Animals": (
         "animal", "ass/donkey", "bear", "bee", "bird", "camel", "cat", "chicken", "cow", 
         "deer", "dog", "duck", "elephant", "female (animal)", "fish", "fly", "fox", 
         "goat", "goose", "herdsman", "horse", "insect", "lion", "livestock", "louse",
         "male (animal)", "manure", "monkey", "mouse/rat", "mule", "pasture", "pig", 
         "sheep", "snake", "stable", "wing", "wolf", "worm"
-    ],
-    "The Body": [
+    ),
+    "The Body": (
         "arm", "back", "bald", "beard", "beget", "bite", "blind", "blood", "body", 
         "bone", "brain", "break wind", "breast", "breathe", "bury", "buttocks", "cheek", 
         "chest", "chin", "claw", "conceive", "corpse", "cough", "cure", "deaf", 
@@ -113,8 +113,8 @@ TARGET_CATEGORIES = {
         "shoulder", "sick", "skin", "skull", "sleep", "sneeze", "spit", "stomach", 
         "strong", "tail", "throat", "thumb", "tired", "toe", "tongue", "tooth", "udder", 
         "urinate", "vomit", "wake up", "weak", "well/health", "womb", "wound", "yawn"
-    ],
-    "Food and Drink": [
+    ),
+    "Food and Drink": (
         "bake", "beer", "boil", "bread", "breakfast", "butter", "cheese", "cook", 
         "dinner", "dough", "drink", "drunk", "eat", "egg", "fat/grease", "feast", 
         "flour", "food", "fruit", "grape", "grind", "honey", "hunger", "hungry", 
@@ -122,28 +122,28 @@ TARGET_CATEGORIES = {
         "olive", "onion", "oven", "pepper", "pour", "roast", "salt", "slice", "smell", 
         "sour", "spice", "stir", "sugar", "supper", "sweet", "taste", "thirst", 
         "thirsty", "vegetable", "vinegar", "wheat", "wine"
-    ],
-    "Clothing and Grooming": [
+    ),
+    "Clothing and Grooming": (
         "apron", "barefoot", "bathe", "belt", "boot", "bracelet", "braid", "brooch", 
         "buckle", "button", "cap", "cloak", "cloth", "clothe", "clothing", "coat", 
         "collar", "comb", "dress", "dye", "garment", "glove", "gown", "hat", "helmet", 
         "hood", "jewel", "linen", "necklace", "needle", "pants", "pin", "pocket", 
         "ring", "robe", "sandal", "scissors", "sew", "shirt", "shoe", "silk", "sleeve", 
         "sock", "spin", "thread", "weave", "wool"
-    ],
-    "The House": [
+    ),
+    "The House": (
         "bed", "blanket", "broom", "building", "ceiling", "chair", "chest", "chimney", 
         "door", "fence", "floor", "furniture", "gate", "hearth", "house", "hut", "key", 
         "lock", "pillow", "roof", "room", "stairs", "table", "village", "wall", "window"
-    ],
-    "Agriculture and Vegetation": [
+    ),
+    "Agriculture and Vegetation": (
         "acre", "bark", "branch", "bud", "crop", "cultivate", "dig", "farm", "farmer", 
         "field", "flower", "fruit", "garden", "grain", "grass", "grow", "harvest", 
         "hay", "leaf", "meadow", "mow", "orchard", "pick", "plant", "plow", "reap", 
         "ripe", "root", "seed", "sow", "sprout", "straw", "thorn", "thresh", "tree", 
         "vegetable", "vine", "weed", "wheat", "wood", "forest", "bush", "log", "stick"
-    ],
-    "Basic Actions and Technology": [
+    ),
+    "Basic Actions and Technology": (
         "axe", "bellows", "bend", "blacksmith", "blade", "blunt", "bow", "break", 
         "build", "carpenter", "carry", "chain", "charcoal", "chisel", "clay", "copper", 
         "craft", "create", "crush", "cut", "drill", "file", "fold", "forge", "gold", 
@@ -152,8 +152,8 @@ TARGET_CATEGORIES = {
         "potter", "press", "pump", "rake", "saw", "scrape", "sharpen", "silver", 
         "smith", "spade", "steel", "strike", "sword", "tin", "tool", "tongs", "wedge", 
         "wheel", "wire", "work"
-    ],
-    "Motion": [
+    ),
+    "Motion": (
         "arrive", "bring", "carry", "chase", "climb", "come", "crawl", "creep", "dance", 
         "descend", "drag", "drive", "enter", "escape", "fall", "flee", "flow", "fly", 
         "follow", "gallop", "go", "hang", "hurry", "jump", "kick", "kneel", "lead", 
@@ -161,16 +161,16 @@ TARGET_CATEGORIES = {
         "raise", "reach", "return", "ride", "rise", "roll", "run", "send", "shake", 
         "sink", "sit", "slide", "slip", "stand", "step", "stop", "swim", "swing", 
         "throw", "travel", "turn", "twist", "wade", "walk", "wander"
-    ],
-    "Possession": [
+    ),
+    "Possession": (
         "barter", "beggar", "borrow", "buy", "change", "cheap", "cost", "debt", "earn", 
         "exchange", "expensive", "free", "gain", "get", "give", "gold", "goods", "guard", 
         "have", "hide", "keep", "lack", "lend", "load", "lose", "market", "merchant", 
         "money", "owe", "own", "pay", "poor", "possess", "price", "property", "receive", 
         "rich", "rob", "save", "sell", "share", "silver", "steal", "store", "take", 
         "thief", "trade", "wealth", "weigh"
-    ],
-    "Spatial Relations": [
+    ),
+    "Spatial Relations": (
         "above", "across", "after", "against", "along", "among", "around", "at", "back", 
         "before", "behind", "below", "beneath", "beside", "between", "beyond", "bottom", 
         "by", "center", "close", "corner", "deep", "direction", "distance", "down", 
@@ -179,8 +179,8 @@ TARGET_CATEGORIES = {
         "opposite", "out", "outside", "over", "place", "right", "side", "south", 
         "straight", "surface", "there", "through", "to", "top", "toward", "under", 
         "up", "west", "where", "wide"
-    ],
-    "Quantity": [
+    ),
+    "Quantity": (
         "all", "both", "count", "double", "each", "empty", "enough", "equal", "every", 
         "few", "first", "full", "group", "grow", "half", "heap", "heavy", "increase", 
         "last", "least", "less", "light", "little", "long", "many", "measure", "more", 
@@ -188,8 +188,8 @@ TARGET_CATEGORIES = {
         "plenty", "second", "several", "short", "single", "size", "some", "tall", 
         "thick", "thin", "total", "whole", "zero", "one", "two", "three", "four", 
         "five", "six", "seven", "eight", "nine", "ten", "hundred", "thousand"
-    ],
-    "Time": [
+    ),
+    "Time": (
         "after", "afternoon", "age", "always", "ancient", "annual", "autumn", "before", 
         "begin", "birthday", "calendar", "century", "date", "dawn", "day", "during", 
         "early", "end", "era", "evening", "ever", "finish", "first", "forever", 
@@ -201,8 +201,8 @@ TARGET_CATEGORIES = {
         "still", "sudden", "summer", "sunrise", "sunset", "then", "time", "today", 
         "tomorrow", "tonight", "week", "when", "while", "winter", "year", "yesterday", 
         "young", "youth"
-    ],
-    "Sense Perception": [
+    ),
+    "Sense Perception": (
         "appear", "beautiful", "bitter", "blind", "blunt", "bright", "clean", "clear", 
         "color", "dark", "deaf", "dim", "dirty", "dull", "feel", "flavor", "fragrant", 
         "hear", "heavy", "hot", "cold", "light", "listen", "look", "loud", "mild", 
@@ -210,8 +210,8 @@ TARGET_CATEGORIES = {
         "sense", "sharp", "shine", "show", "silent", "smell", "smooth", "soft", "solid", 
         "sound", "sour", "stink", "sweet", "taste", "thick", "thin", "touch", "ugly", 
         "visible", "warm", "watch", "wet"
-    ],
-    "Emotions and Values": [
+    ),
+    "Emotions and Values": (
         "admire", "afraid", "amuse", "anger", "angry", "annoy", "anxiety", "ashamed", 
         "bad", "blame", "bold", "bore", "brave", "calm", "careful", "careless", 
         "comfort", "complain", "courage", "coward", "cruel", "cry", "curious", 
@@ -224,16 +224,16 @@ TARGET_CATEGORIES = {
         "regret", "respect", "revenge", "right", "sad", "satisfy", "shame", "shy", 
         "sorrow", "sorry", "suffer", "surprise", "sympathy", "temper", "thank", "true", 
         "trust", "vanity", "weep", "wicked", "wise", "wish", "wonder", "worry", "wrong"
-    ],
-    "Cognition": [
+    ),
+    "Cognition": (
         "believe", "compare", "consider", "decide", "doubt", "expect", "explain", 
         "forget", "guess", "idea", "ignore", "imagine", "intend", "judge", "know", 
         "knowledge", "learn", "mean", "memory", "mind", "mistake", "notice", "opinion", 
         "perceive", "plan", "prefer", "prove", "purpose", "realize", "reason", 
         "recognize", "remember", "secret", "solve", "suppose", "teach", "think", 
         "thought", "understand", "wisdom", "wise", "wonder"
-    ],
-    "Speech and Language": [
+    ),
+    "Speech and Language": (
         "admit", "advise", "agree", "announce", "answer", "argue", "ask", "boast", 
         "call", "claim", "command", "complain", "confess", "conversation", "cry", 
         "curse", "declare", "deny", "describe", "discuss", "exclaim", "explain", 
@@ -244,8 +244,8 @@ TARGET_CATEGORIES = {
         "secret", "shout", "shut up", "sign", "silence", "sing", "speak", "speech", 
         "story", "suggest", "swear", "talk", "teach", "tell", "thank", "threaten", 
         "translate", "voice", "warn", "whisper", "word", "write", "yell"
-    ],
-    "Social and Political Relations": [
+    ),
+    "Social and Political Relations": (
         "allow", "army", "attack", "battle", "betray", "capture", "chief", "city", 
         "citizen", "command", "conquer", "country", "defeat", "defend", "empire", 
         "enemy", "execute", "exile", "flag", "foreign", "free", "freedom", "friend", 
@@ -257,16 +257,16 @@ TARGET_CATEGORIES = {
         "servant", "serve", "shield", "slave", "soldier", "spy", "stranger", "subject", 
         "surrender", "throne", "tower", "traitor", "treason", "treaty", "tribe", 
         "troop", "victory", "village", "war", "warrior", "weapon"
-    ],
-    "Warfare and Hunting": [
+    ),
+    "Warfare and Hunting": (
         "aim", "ambush", "archer", "armor", "army", "arrow", "attack", "battle", "bow", 
         "capture", "conquer", "defend", "enemy", "fight", "flee", "fortress", "guard", 
         "helmet", "hide", "hit", "hunt", "hunter", "kill", "net", "peace", "pursue", 
         "quiver", "retreat", "scout", "shield", "shoot", "siege", "slay", "soldier", 
         "spear", "spy", "stab", "strike", "surrender", "sword", "target", "trap", 
         "troop", "victory", "war", "warrior", "weapon", "wound"
-    ],
-    "Law": [
+    ),
+    "Law": (
         "accuse", "arrest", "authority", "ban", "blame", "court", "crime", "criminal", 
         "custom", "debt", "deserve", "duty", "evidence", "execute", "fault", "fine", 
         "forbid", "forgive", "free", "guilty", "heir", "inherit", "innocent", "judge", 
@@ -275,18 +275,18 @@ TARGET_CATEGORIES = {
         "property", "prove", "punish", "release", "right", "rule", "sentence", "sue", 
         "swear", "testify", "thief", "trial", "verdict", "victim", "violate", "witness", 
         "wrong"
-    ],
-    "Religion and Belief": [
+    ),
+    "Religion and Belief": (
         "angel", "believe", "bless", "bury", "ceremony", "church", "curse", "demon", 
         "devil", "divine", "faith", "fast", "feast", "funeral", "ghost", "god", 
         "goddess", "grace", "grave", "heaven", "hell", "holy", "idol", "magic", 
         "miracle", "monk", "oracle", "paradise", "pilgrim", "pray", "prayer", "preach", 
         "priest", "prophet", "religion", "sacred", "sacrifice", "saint", "save", "sin", 
         "soul", "spirit", "temple", "tomb", "virgin", "witch", "worship"
-    ],
-    "Question Words": [
+    ),
+    "Question Words": (
         "how", "what", "when", "where", "which", "who", "whom", "whose", "why"
-    ]
+    )
 }
 
 def load_dictionary(dict_path):
@@ -309,8 +309,8 @@ def normalize_word(word):
     word = word.replace('like/love', 'like')
     return word
 
-def check_coverage(dictionary_words, target_list):
-    """Check what percentage of target list is covered."""
+def build_dict_indexes(dictionary_words):
+    """Build the English lookup sets used by check_coverage, in one pass."""
     dict_english = set()
     dict_base_words = set()  # Store base words without parenthetical qualifiers
     
@@ -329,36 +329,34 @@ def check_coverage(dictionary_words, target_list):
             base = eng.split('(')[0].strip()
             dict_base_words.add(base)
     
-    have = []
-    missing = []
+    return dict_english, dict_base_words
+
+def check_coverage(dict_english, dict_base_words, target_list):
+    """Check what percentage of target list is covered."""
+    # Normalize each target once; the set ops and result lists reuse it
+    targets = [(word, word.lower().strip()) for word in target_list]
+    norms = {norm for _, norm in targets}
     
-    for word in target_list:
-        word_lower = word.lower().strip()
-        found = False
-        
-        # Exact match
-        if word_lower in dict_english:
-            found = True
-        # Base word match (for pronouns like "we" matching "we (masculine/mixed)")
-        elif word_lower in dict_base_words:
-            found = True
+    # Exact and base word matches (for pronouns like "we" matching
+    # "we (masculine/mixed)") as bulk set intersections
+    found = (norms & dict_english) | (norms & dict_base_words)
+    
+    for norm in norms - found:
         # Target has slash - check variants
-        elif '/' in word:
-            for part in word.split('/'):
-                part_clean = part.strip().lower()
+        if '/' in norm:
+            for part in norm.split('/'):
+                part_clean = part.strip()
                 if part_clean in dict_english or part_clean in dict_base_words:
-                    found = True
+                    found.add(norm)
                     break
         # Target has parenthetical - try base word
-        elif '(' in word:
-            base = word.split('(')[0].strip().lower()
+        elif '(' in norm:
+            base = norm.split('(')[0].strip()
             if base in dict_english or base in dict_base_words:
-                found = True
-        
-        if found:
-            have.append(word)
-        else:
-            missing.append(word)
+                found.add(norm)
+    
+    have = [word for word, norm in targets if norm in found]
+    missing = [word for word, norm in targets if norm not in found]
     
     return have, missing
 
@@ -402,22 +400,23 @@ def main():
     words = load_dictionary(dict_path)
     total_words = len(words)
     unique_words = get_unique_word_count(words)
+    dict_english, dict_base_words = build_dict_indexes(words)
     
     # Check Swadesh coverage
-    sw100_have, sw100_missing = check_coverage(words, SWADESH_100)
-    sw207_have, sw207_missing = check_coverage(words, SWADESH_207)
+    sw100_have, sw100_missing = check_coverage(dict_english, dict_base_words, SWADESH_100)
+    sw207_have, sw207_missing = check_coverage(dict_english, dict_base_words, SWADESH_207)
     
     # Check extended list coverage
-    wold_have, wold_missing = check_coverage(words, WOLD) if WOLD else ([], [])
-    concept_have, concept_missing = check_coverage(words, CONCEPTICON) if CONCEPTICON else ([], [])
-    northeur_have, northeur_missing = check_coverage(words, NORTHEURALEX) if NORTHEURALEX else ([], [])
-    zompist_have, zompist_missing = check_coverage(words, ZOMPIST) if ZOMPIST else ([], [])
+    wold_have, wold_missing = check_coverage(dict_english, dict_base_words, WOLD) if WOLD else ([], [])
+    concept_have, concept_missing = check_coverage(dict_english, dict_base_words, CONCEPTICON) if CONCEPTICON else ([], [])
+    northeur_have, northeur_missing = check_coverage(dict_english, dict_base_words, NORTHEURALEX) if NORTHEURALEX else ([], [])
+    zompist_have, zompist_missing = check_coverage(dict_english, dict_base_words, ZOMPIST) if ZOMPIST else ([], [])
     
     # Check category coverage
     all_target_words = []
     category_stats = {}
     for cat_name, cat_words in TARGET_CATEGORIES.items():
-        have, missing = check_coverage(words, cat_words)
+        have, missing = check_coverage(dict_english, dict_base_words, cat_words)
         category_stats[cat_name] = {
             'total': len(cat_words),
             'have': len(have),
@@ -429,7 +428,7 @@ def main():
     
     # Deduplicate target words
     all_target_words = list(set(all_target_words))
-    all_have, all_missing = check_coverage(words, all_target_words)
+    all_have, all_missing = check_coverage(dict_english, dict_base_words, all_target_words)
     
     # Output
     if args.summary: